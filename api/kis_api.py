@@ -5,12 +5,14 @@
 import requests
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from config import Config
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -25,11 +27,77 @@ class KISApi:
         self.account_code = Config.KIS_ACCOUNT_CODE
         self.access_token = None
         self.token_expires_at = None
+        self._token_lock = threading.Lock()
+        # 요청마다 새 연결(TLS 핸드셰이크)을 맺지 않도록 keep-alive 세션을 재사용
+        # (스레드 풀 동시 요청 수만큼 연결을 유지)
+        # 스레드 풀 간 공유: 생성 후에는 어댑터/기본 헤더 등 세션 상태를 바꾸지 않고 요청만 보내며,
+        # 인증은 요청별 헤더로만 전달해 쿠키 저장소도 쓰지 않음. 연결 풀(urllib3)은 스레드 안전하므로
+        # 요청 전송만 하는 이 용도에서는 세션 하나를 여러 스레드가 함께 써도 안전함
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=Config.API_MAX_WORKERS
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # 초당 호출 한도: 스레드 간 공유하는 다음 요청 가능 시각 (time.monotonic 기준)
+        self._rate_lock = threading.Lock()
+        self._min_interval = 1.0 / Config.API_MAX_RPS
+        self._next_slot = 0.0
+
+    def close(self):
+        """HTTP 세션 종료 (프로그램/스케줄러 종료 시 유지 중인 연결 반환)"""
+        self.session.close()
+
+    def _throttle(self):
+        """요청 시작 간격을 1/API_MAX_RPS초 이상으로 벌려 초당 호출 한도를 지킴 (모든 스레드 공유)"""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._min_interval
+        # 잠금 밖에서 대기해 다른 스레드가 다음 순번을 바로 예약할 수 있게 함
+        if slot > now:
+            time.sleep(slot - now)
+
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """초당 호출 한도 초과 응답 여부 (HTTP 429 또는 KIS 게이트웨이 오류코드 EGW00201)"""
+        if response.status_code == 429:
+            return True
+        if response.ok:
+            return False
+        try:
+            return response.json().get("msg_cd") == "EGW00201"
+        except ValueError:
+            return False
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        모든 KIS 호출의 공통 경로: 초당 호출 한도 적용 + 한도 초과 응답 재시도
+
+        한도 초과 응답은 게이트웨이에서 거절된 요청이라 주문도 체결되지 않았으므로
+        대기 후 다시 보내도 중복 주문이 되지 않습니다.
+        재시도를 모두 소진하면 마지막 응답을 그대로 반환합니다 (호출부가 오류로 기록).
+        """
+        retries = Config.API_RATE_LIMIT_RETRIES
+        for attempt in range(retries + 1):
+            self._throttle()
+            response = self.session.request(method, url, **kwargs)
+            if attempt == retries or not self._is_rate_limited(response):
+                return response
+            backoff = Config.API_RATE_LIMIT_BACKOFF * (2 ** attempt)
+            logger.warning(
+                "⚠️  KIS 초당 호출 한도 초과 - %.1f초 후 재시도 (%d/%d): %s",
+                backoff, attempt + 1, retries, url
+            )
+            time.sleep(backoff)
 
     def _get_headers(self, tr_id: str, content_type: str = "application/json") -> Dict:
         """API 요청 헤더 생성"""
         if not self.access_token or datetime.now() >= self.token_expires_at:
-            self._issue_token()
+            # 여러 스레드가 동시에 만료를 감지해도 토큰은 한 번만 발급
+            with self._token_lock:
+                if not self.access_token or datetime.now() >= self.token_expires_at:
+                    self._issue_token()
 
         return {
             "content-type": content_type,
@@ -50,7 +118,7 @@ class KISApi:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=body)
+            response = self._request("POST", url, headers=headers, json=body)
             response.raise_for_status()
             data = response.json()
 
@@ -81,7 +149,7 @@ class KISApi:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -105,6 +173,26 @@ class KISApi:
             logger.error(f"❌ 시세 조회 오류 ({stock_code}): {e}")
             return None
 
+    def get_stock_price_bulk(self, stock_codes: List[str]) -> Dict[str, Dict]:
+        """
+        여러 종목의 현재가 일괄 조회
+
+        종목별 요청을 스레드 풀로 동시에 보내 왕복 대기 시간을 겹칩니다.
+
+        Args:
+            stock_codes: 종목코드 리스트
+
+        Returns:
+            {종목코드: 현재가 정보} (조회 실패 종목은 제외)
+        """
+        codes = list(dict.fromkeys(stock_codes))
+        if not codes:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=Config.API_MAX_WORKERS) as executor:
+            results = executor.map(self.get_stock_price, codes)
+            return {code: info for code, info in zip(codes, results) if info is not None}
+
     def get_top_gainers(self, count: int = 20) -> List[Dict]:
         """
         등락률 상위 종목 조회
@@ -132,7 +220,7 @@ class KISApi:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -189,7 +277,7 @@ class KISApi:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -239,7 +327,7 @@ class KISApi:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -281,7 +369,7 @@ class KISApi:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -317,7 +405,7 @@ class KISApi:
             주문 성공 여부
         """
         if not Config.TRADING_ENABLED:
-            logger.info(f"🔵 [모의] {order_type.upper()} 주문: {stock_code} {quantity}주 @ {price}원")
+            logger.info("🔵 [모의] %s 주문: %s %d주 @ %s원", order_type.upper(), stock_code, quantity, price)
             return True
 
         url = f"{self.base_url}/uapi/domestic-stock/v1/trading/order-cash"
@@ -336,12 +424,12 @@ class KISApi:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=body)
+            response = self._request("POST", url, headers=headers, json=body)
             response.raise_for_status()
             data = response.json()
 
             if data["rt_cd"] == "0":
-                logger.info(f"✅ {order_type.upper()} 주문 성공: {stock_code} {quantity}주")
+                logger.info("✅ %s 주문 성공: %s %d주", order_type.upper(), stock_code, quantity)
                 return True
             else:
                 logger.error(f"❌ 주문 실패: {data['msg1']}")
@@ -375,7 +463,7 @@ class KISApi:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._request("GET", url, headers=headers, params=params)
             response.raise_for_status()
             data = response.json()
 
@@ -9,6 +9,8 @@ from dataclasses import dataclass
 import json
 from pathlib import Path
 
+import numpy as np
+
 from api import KISApi
 from strategy import (
     StockScreener,
@@ -17,13 +19,19 @@ from strategy import (
     IntradayAnalyzer
 )
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 @dataclass
 class BacktestTrade:
     """백테스트 거래 기록"""
+    # 거래 건수만큼 생성되므로 인스턴스별 __dict__ 없이 저장
+    # (기본값 없는 필드만 있으므로 dataclass와 __slots__를 함께 사용 가능)
+    __slots__ = (
+        'date', 'stock_code', 'stock_name', 'entry_price', 'exit_price',
+        'quantity', 'profit', 'profit_rate', 'hold_days', 'exit_reason',
+    )
+
     date: str
     stock_code: str
     stock_name: str
@@ -119,9 +127,12 @@ class Backtester:
         trades: List[BacktestTrade] = []
         daily_capitals: List[int] = [self.initial_capital]
 
+        # 거래일/거래별 로그는 INFO가 꺼져 있으면 문자열 포맷팅부터 생략 (레벨은 실행 중 고정)
+        log_info = logger.isEnabledFor(logging.INFO)
+
         # 각 거래일에 대해 시뮬레이션
         for idx, trade_date in enumerate(trading_days, 1):
-            logger.info(f"\n[{idx}/{len(trading_days)}] 📆 {trade_date}")
+            logger.info("\n[%d/%d] 📆 %s", idx, len(trading_days), trade_date)
 
             # 보유 종목 매도 처리 (익일 오전)
             if holdings:
@@ -147,20 +158,22 @@ class Backtester:
                     investment = holding['entry_price'] * holding['quantity']
                     current_capital -= investment
                     holdings.append(holding)
-                    logger.info(
-                        f"  ✅ 매수: {holding['stock_name']} "
-                        f"{holding['quantity']}주 @ {holding['entry_price']:,}원 "
-                        f"(투자금: {investment:,}원)"
-                    )
+                    if log_info:
+                        logger.info(
+                            f"  ✅ 매수: {holding['stock_name']} "
+                            f"{holding['quantity']}주 @ {holding['entry_price']:,}원 "
+                            f"(투자금: {investment:,}원)"
+                        )
 
             # 일일 자본 기록 (현금 + 보유 종목 평가액)
             holdings_value = sum(h['entry_price'] * h['quantity'] for h in holdings)
             total_capital = current_capital + holdings_value
             daily_capitals.append(total_capital)
 
-            logger.info(f"  💵 현금: {current_capital:,}원 | "
-                       f"보유: {holdings_value:,}원 | "
-                       f"총 자산: {total_capital:,}원")
+            if log_info:
+                logger.info(f"  💵 현금: {current_capital:,}원 | "
+                           f"보유: {holdings_value:,}원 | "
+                           f"총 자산: {total_capital:,}원")
 
         # 최종 결산: 남은 보유 종목 강제 청산
         if holdings:
@@ -311,6 +324,12 @@ class Backtester:
         """
         remaining_holdings = []
         completed_trades = []
+        log_info = logger.isEnabledFor(logging.INFO)
+        # 보유 종목 시세를 한 번에 동시 조회 (같은 종목을 여러 건 보유해도 조회는 1회)
+        try:
+            prices = self.api.get_stock_price_bulk([h['stock_code'] for h in holdings])
+        except Exception:
+            prices = {}
 
         for holding in holdings:
             stock_code = holding['stock_code']
@@ -320,14 +339,11 @@ class Backtester:
             entry_date = holding['entry_date']
 
             # 익일 종가 조회 (실제로는 sell_date의 실제 가격 조회 필요)
-            try:
-                price_info = self.api.get_stock_price(stock_code)
-                if price_info:
-                    exit_price = price_info['current_price']
-                else:
-                    # 가격 조회 실패 시 진입가로 청산
-                    exit_price = entry_price
-            except:
+            price_info = prices.get(stock_code)
+            if price_info:
+                exit_price = price_info['current_price']
+            else:
+                # 가격 조회 실패 시 진입가로 청산
                 exit_price = entry_price
 
             # 수익 계산
@@ -361,10 +377,11 @@ class Backtester:
                 )
                 completed_trades.append(trade)
 
-                logger.info(
-                    f"  💸 매도: {stock_name} {quantity}주 @ {exit_price:,}원 "
-                    f"(수익: {profit:,}원, {profit_rate:+.2f}%)"
-                )
+                if log_info:
+                    logger.info(
+                        f"  💸 매도: {stock_name} {quantity}주 @ {exit_price:,}원 "
+                        f"(수익: {profit:,}원, {profit_rate:+.2f}%)"
+                    )
             else:
                 remaining_holdings.append(holding)
 
@@ -381,24 +398,25 @@ class Backtester:
     ) -> BacktestResult:
         """성과 분석"""
 
-        # 기본 통계
+        # 거래별 수익/수익률을 배열로 한 번 모아 마스크로 집계
         total_trades = len(trades)
-        winning_trades = sum(1 for t in trades if t.profit > 0)
-        losing_trades = sum(1 for t in trades if t.profit < 0)
+        profits = np.fromiter((t.profit for t in trades), dtype=np.float64, count=total_trades)
+        profit_rates = np.fromiter((t.profit_rate for t in trades), dtype=np.float64, count=total_trades)
+        win_mask = profits > 0
+        loss_mask = profits < 0
+
+        # 기본 통계
+        winning_trades = int(win_mask.sum())
+        losing_trades = int(loss_mask.sum())
 
         win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
 
         # 수익률 통계
         total_return = ((final_capital - initial_capital) / initial_capital) * 100
 
-        profit_rates = [t.profit_rate for t in trades]
-        avg_profit_rate = sum(profit_rates) / len(profit_rates) if profit_rates else 0
-
-        win_rates = [t.profit_rate for t in trades if t.profit > 0]
-        avg_win_rate = sum(win_rates) / len(win_rates) if win_rates else 0
-
-        loss_rates = [t.profit_rate for t in trades if t.profit < 0]
-        avg_loss_rate = sum(loss_rates) / len(loss_rates) if loss_rates else 0
+        avg_profit_rate = float(profit_rates.mean()) if total_trades else 0
+        avg_win_rate = float(profit_rates[win_mask].mean()) if winning_trades else 0
+        avg_loss_rate = float(profit_rates[loss_mask].mean()) if losing_trades else 0
 
         # 최대 낙폭 (MDD)
         max_drawdown = self._calculate_max_drawdown(daily_capitals)
@@ -407,10 +425,8 @@ class Backtester:
         sharpe_ratio = self._calculate_sharpe_ratio(daily_capitals)
 
         # 일일 수익률
-        daily_returns = [
-            ((daily_capitals[i] - daily_capitals[i-1]) / daily_capitals[i-1]) * 100
-            for i in range(1, len(daily_capitals))
-        ]
+        capitals = np.asarray(daily_capitals, dtype=np.float64)
+        daily_returns = ((np.diff(capitals) / capitals[:-1]) * 100).tolist()
 
         return BacktestResult(
             start_date=start_date,
@@ -436,18 +452,12 @@ class Backtester:
         if not daily_capitals:
             return 0.0
 
-        max_capital = daily_capitals[0]
-        max_dd = 0.0
+        # 누적 최고점 대비 낙폭을 한 번에 계산
+        capitals = np.asarray(daily_capitals, dtype=np.float64)
+        peaks = np.maximum.accumulate(capitals)
+        drawdowns = ((peaks - capitals) / peaks) * 100
 
-        for capital in daily_capitals:
-            if capital > max_capital:
-                max_capital = capital
-
-            drawdown = ((max_capital - capital) / max_capital) * 100
-            if drawdown > max_dd:
-                max_dd = drawdown
-
-        return max_dd
+        return max(float(drawdowns.max()), 0.0)
 
     def _calculate_sharpe_ratio(self, daily_capitals: List[int]) -> float:
         """샤프 비율 계산 (연환산)"""
@@ -455,18 +465,12 @@ class Backtester:
             return 0.0
 
         # 일일 수익률 계산
-        daily_returns = [
-            (daily_capitals[i] - daily_capitals[i-1]) / daily_capitals[i-1]
-            for i in range(1, len(daily_capitals))
-        ]
-
-        if not daily_returns:
-            return 0.0
+        capitals = np.asarray(daily_capitals, dtype=np.float64)
+        daily_returns = np.diff(capitals) / capitals[:-1]
 
-        # 평균 및 표준편차
-        avg_return = sum(daily_returns) / len(daily_returns)
-        variance = sum((r - avg_return) ** 2 for r in daily_returns) / len(daily_returns)
-        std_return = variance ** 0.5
+        # 평균 및 표준편차 (모표준편차)
+        avg_return = float(daily_returns.mean())
+        std_return = float(daily_returns.std())
 
         if std_return == 0:
             return 0.0
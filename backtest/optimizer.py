@@ -11,7 +11,6 @@ from datetime import datetime
 from backtest.backtester import Backtester, BacktestResult
 from api import KISApi
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
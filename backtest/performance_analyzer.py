@@ -8,9 +8,10 @@ from typing import List, Dict, Optional
 from pathlib import Path
 import json
 
+import numpy as np
+
 from strategy import TradeHistory
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -53,19 +54,16 @@ class PerformanceAnalyzer:
 
         # 통계 계산
         total_trades = len(daily_trades)
-        total_profit = sum(t['profit'] for t in daily_trades)
-        winning_trades = [t for t in daily_trades if t['profit'] > 0]
-        losing_trades = [t for t in daily_trades if t['profit'] < 0]
+        total_profit, win_count, loss_count, avg_profit_rate = self._summarize_trades(daily_trades)
 
-        win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
-        avg_profit_rate = sum(t['profit_rate'] for t in daily_trades) / total_trades
+        win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0
 
         report = {
             "date": date,
             "total_trades": total_trades,
             "total_profit": total_profit,
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
+            "winning_trades": win_count,
+            "losing_trades": loss_count,
             "win_rate": win_rate,
             "avg_profit_rate": avg_profit_rate,
             "trades": daily_trades
@@ -74,8 +72,8 @@ class PerformanceAnalyzer:
         # 출력
         logger.info(f"📈 총 거래: {total_trades}건")
         logger.info(f"💰 총 수익: {total_profit:,}원")
-        logger.info(f"✅ 수익 거래: {len(winning_trades)}건")
-        logger.info(f"❌ 손실 거래: {len(losing_trades)}건")
+        logger.info(f"✅ 수익 거래: {win_count}건")
+        logger.info(f"❌ 손실 거래: {loss_count}건")
         logger.info(f"🎲 승률: {win_rate:.2f}%")
         logger.info(f"📊 평균 수익률: {avg_profit_rate:+.2f}%\n")
 
@@ -127,12 +125,9 @@ class PerformanceAnalyzer:
 
         # 통계 계산
         total_trades = len(weekly_trades)
-        total_profit = sum(t['profit'] for t in weekly_trades)
-        winning_trades = [t for t in weekly_trades if t['profit'] > 0]
-        losing_trades = [t for t in weekly_trades if t['profit'] < 0]
+        total_profit, win_count, loss_count, avg_profit_rate = self._summarize_trades(weekly_trades)
 
-        win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
-        avg_profit_rate = sum(t['profit_rate'] for t in weekly_trades) / total_trades
+        win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0
 
         # 일별 수익 분석
         daily_profits = {}
@@ -147,8 +142,8 @@ class PerformanceAnalyzer:
             "end_date": end_date,
             "total_trades": total_trades,
             "total_profit": total_profit,
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
+            "winning_trades": win_count,
+            "losing_trades": loss_count,
             "win_rate": win_rate,
             "avg_profit_rate": avg_profit_rate,
             "daily_profits": daily_profits,
@@ -158,8 +153,8 @@ class PerformanceAnalyzer:
         # 출력
         logger.info(f"📈 총 거래: {total_trades}건")
         logger.info(f"💰 총 수익: {total_profit:,}원")
-        logger.info(f"✅ 수익 거래: {len(winning_trades)}건")
-        logger.info(f"❌ 손실 거래: {len(losing_trades)}건")
+        logger.info(f"✅ 수익 거래: {win_count}건")
+        logger.info(f"❌ 손실 거래: {loss_count}건")
         logger.info(f"🎲 승률: {win_rate:.2f}%")
         logger.info(f"📊 평균 수익률: {avg_profit_rate:+.2f}%\n")
 
@@ -203,12 +198,9 @@ class PerformanceAnalyzer:
 
         # 통계 계산
         total_trades = len(monthly_trades)
-        total_profit = sum(t['profit'] for t in monthly_trades)
-        winning_trades = [t for t in monthly_trades if t['profit'] > 0]
-        losing_trades = [t for t in monthly_trades if t['profit'] < 0]
+        total_profit, win_count, loss_count, avg_profit_rate = self._summarize_trades(monthly_trades)
 
-        win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
-        avg_profit_rate = sum(t['profit_rate'] for t in monthly_trades) / total_trades
+        win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0
 
         # 최대 수익/손실 거래
         best_trade = max(monthly_trades, key=lambda t: t['profit_rate'])
@@ -237,8 +229,8 @@ class PerformanceAnalyzer:
             "month": month,
             "total_trades": total_trades,
             "total_profit": total_profit,
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
+            "winning_trades": win_count,
+            "losing_trades": loss_count,
             "win_rate": win_rate,
             "avg_profit_rate": avg_profit_rate,
             "best_trade": best_trade,
@@ -250,8 +242,8 @@ class PerformanceAnalyzer:
         # 출력
         logger.info(f"📈 총 거래: {total_trades}건")
         logger.info(f"💰 총 수익: {total_profit:,}원")
-        logger.info(f"✅ 수익 거래: {len(winning_trades)}건")
-        logger.info(f"❌ 손실 거래: {len(losing_trades)}건")
+        logger.info(f"✅ 수익 거래: {win_count}건")
+        logger.info(f"❌ 손실 거래: {loss_count}건")
         logger.info(f"🎲 승률: {win_rate:.2f}%")
         logger.info(f"📊 평균 수익률: {avg_profit_rate:+.2f}%\n")
 
@@ -324,16 +316,10 @@ class PerformanceAnalyzer:
 
         # 통계 계산
         total_trades = len(period_trades)
-        total_profit = sum(t['profit'] for t in period_trades)
+        total_profit, win_count, loss_count, avg_profit_rate = self._summarize_trades(period_trades)
         total_investment = sum(t['buy_price'] * t['quantity'] for t in period_trades)
 
-        winning_trades = [t for t in period_trades if t['profit'] > 0]
-        losing_trades = [t for t in period_trades if t['profit'] < 0]
-
-        win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
-
-        profit_rates = [t['profit_rate'] for t in period_trades]
-        avg_profit_rate = sum(profit_rates) / len(profit_rates) if profit_rates else 0
+        win_rate = (win_count / total_trades * 100) if total_trades > 0 else 0
 
         # 연속 승/패 분석
         max_consecutive_wins = self._calculate_max_consecutive(period_trades, win=True)
@@ -346,8 +332,8 @@ class PerformanceAnalyzer:
             "total_profit": total_profit,
             "total_investment": total_investment,
             "roi": (total_profit / total_investment * 100) if total_investment > 0 else 0,
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
+            "winning_trades": win_count,
+            "losing_trades": loss_count,
             "win_rate": win_rate,
             "avg_profit_rate": avg_profit_rate,
             "max_consecutive_wins": max_consecutive_wins,
@@ -360,8 +346,8 @@ class PerformanceAnalyzer:
         logger.info(f"💰 총 수익: {total_profit:,}원")
         logger.info(f"💵 총 투자금: {total_investment:,}원")
         logger.info(f"📊 ROI: {report['roi']:+.2f}%")
-        logger.info(f"✅ 수익 거래: {len(winning_trades)}건")
-        logger.info(f"❌ 손실 거래: {len(losing_trades)}건")
+        logger.info(f"✅ 수익 거래: {win_count}건")
+        logger.info(f"❌ 손실 거래: {loss_count}건")
         logger.info(f"🎲 승률: {win_rate:.2f}%")
         logger.info(f"📊 평균 수익률: {avg_profit_rate:+.2f}%")
         logger.info(f"🔥 최대 연속 승: {max_consecutive_wins}회")
@@ -376,6 +362,23 @@ class PerformanceAnalyzer:
 
         return report
 
+    @staticmethod
+    def _summarize_trades(trades: List[Dict]) -> tuple:
+        """
+        거래 리스트 요약: (총 수익, 수익 거래 수, 손실 거래 수, 평균 수익률)
+
+        수익/수익률을 배열로 한 번만 모아 합계와 승패 집계를 numpy로 계산합니다.
+        (호출부는 거래가 1건 이상일 때만 호출)
+        """
+        profits = np.array([t['profit'] for t in trades])
+        profit_rates = np.array([t['profit_rate'] for t in trades], dtype=np.float64)
+        return (
+            profits.sum().item(),
+            int(np.count_nonzero(profits > 0)),
+            int(np.count_nonzero(profits < 0)),
+            float(profit_rates.mean()),
+        )
+
     def _calculate_max_consecutive(self, trades: List[Dict], win: bool = True) -> int:
         """연속 승/패 계산"""
         max_consecutive = 0
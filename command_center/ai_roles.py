@@ -5,7 +5,6 @@ Crawler, Explorer, Analyst의 세부 기능을 구현합니다.
 import logging
 from typing import List, Dict
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class Crawler:
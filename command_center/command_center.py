@@ -2,13 +2,14 @@
 커맨드 센터 - AI 오케스트레이션 (v2.0)
 Claude Opus(Commander)를 필두로 한 AI 협업 체계를 구현합니다.
 """
+import heapq
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime
+from operator import itemgetter
 from strategy.ensemble import EnsembleEngine
 from strategy.risk_manager import MacroFilter, RiskLevel
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class CommandCenter:
@@ -35,17 +36,16 @@ class CommandCenter:
         
         # 1. 거시 환경 필터링
         regime = self.macro_filter.check_market_regime(market_data)
-        logger.info(f"🌐 시장 레짐: {regime['level'].value} ({regime['reason']})")
+        logger.info("🌐 시장 레짐: %s (%s)", regime['level'].value, regime['reason'])
         
         if regime['level'] == RiskLevel.DANGER:
             logger.warning("🚨 DANGER 레짐: 모든 신규 진입을 금지합니다.")
             return []
 
-        # 2. 종목별 앙상블 점수 산출
+        # 2. 종목별 앙상블 점수 산출 (후보 전체를 한 번에 계산)
+        # Phase 2, 3 점수 등을 stock 데이터에 포함시켜 전달
         final_picks = []
-        for stock in candidates:
-            # Phase 2, 3 점수 등을 stock 데이터에 포함시켜 전달
-            res = self.ensemble.get_ensemble_score(stock)
+        for stock, res in zip(candidates, self.ensemble.get_ensemble_scores(candidates)):
             stock.update(res)
             
             if res['entry_grade'] != "SKIP":
@@ -53,21 +53,23 @@ class CommandCenter:
                 stock['weight_multiplier'] = regime['multiplier']
                 final_picks.append(stock)
                 
-        # 3. 최종 순위화 및 비중 결정
-        final_picks.sort(key=lambda x: x['total_score'], reverse=True)
-        
+        # 3. 최종 순위화 및 비중 결정 (최대 3종목만 필요하므로 전체 정렬 대신 부분 선택)
         decisions = []
-        for stock in final_picks[:3]: # 최대 3종목
+        for stock in heapq.nlargest(3, final_picks, key=itemgetter('total_score')):
             decision = {
                 "symbol": stock['stock_code'],
                 "name": stock['stock_name'],
+                "price": stock.get('current_price', 0),
                 "grade": stock['entry_grade'],
                 "score": stock['total_score'],
                 "multiplier": stock['weight_multiplier'],
                 "reason": f"앙상블 {stock['total_score']}점 ({stock['entry_grade']})"
             }
             decisions.append(decision)
-            logger.info(f"✅ 최종 선정: {stock['stock_name']} | 점수: {stock['total_score']} | 등급: {stock['entry_grade']}")
+            logger.info(
+                "✅ 최종 선정: %s | 점수: %s | 등급: %s",
+                stock['stock_name'], stock['total_score'], stock['entry_grade']
+            )
             
         return decisions
 
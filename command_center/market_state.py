@@ -9,7 +9,6 @@ from api import KISApi
 from strategy import TradeHistory
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -48,28 +47,30 @@ class MarketState:
         # 거래 통계
         stats = self.trade_history.get_statistics(recent_trades=20)
 
-        # 후보 종목 특성 계산
-        avg_trading_value = np.mean([c['trading_value'] for c in candidates])
-        avg_change_rate = np.mean([c['change_rate'] for c in candidates])
-        avg_score = np.mean([c.get('score', 0) for c in candidates])
-
-        # 주도주 비율 (1조 이상)
-        dominant_ratio = sum(1 for c in candidates if c['trading_value'] >= 1000000000000) / len(candidates)
-
-        # 신고가 비율
-        new_high_ratio = sum(1 for c in candidates if c.get('is_new_high', False)) / len(candidates)
-
-        # 정배열 비율
-        aligned_ratio = sum(1 for c in candidates if c.get('is_aligned', False)) / len(candidates)
-
-        # 200일선 상승 비율
-        ma200_uptrend_ratio = sum(1 for c in candidates if c.get('ma200_uptrend', False)) / len(candidates)
-
-        # 외국인+기관 동반 매수 비율
-        both_buying_ratio = sum(
-            1 for c in candidates
-            if c.get('investor_buying', {}).get('both_buying', False)
-        ) / len(candidates)
+        # 후보 종목 특성 계산: 합계/개수를 한 번의 순회로 모두 집계
+        # (후보 수십 개 수준이라 np.mean 대신 내장 산술 사용)
+        total_trading_value = total_change_rate = total_score = 0
+        dominant = new_high = aligned = ma200_uptrend = both_buying = 0
+        for c in candidates:
+            trading_value = c['trading_value']
+            total_trading_value += trading_value
+            total_change_rate += c['change_rate']
+            total_score += c.get('score', 0)
+            dominant += trading_value >= 1000000000000  # 주도주 (1조 이상)
+            new_high += bool(c.get('is_new_high', False))
+            aligned += bool(c.get('is_aligned', False))
+            ma200_uptrend += bool(c.get('ma200_uptrend', False))
+            both_buying += bool(c.get('investor_buying', {}).get('both_buying', False))
+
+        n = len(candidates)
+        avg_trading_value = total_trading_value / n
+        avg_change_rate = total_change_rate / n
+        avg_score = total_score / n
+        dominant_ratio = dominant / n  # 주도주 비율
+        new_high_ratio = new_high / n  # 신고가 비율
+        aligned_ratio = aligned / n  # 정배열 비율
+        ma200_uptrend_ratio = ma200_uptrend / n  # 200일선 상승 비율
+        both_buying_ratio = both_buying / n  # 외국인+기관 동반 매수 비율
 
         # 거래 실적
         win_rate = stats['win_rate']
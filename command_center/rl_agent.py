@@ -9,7 +9,6 @@ from pathlib import Path
 from typing import Dict, Tuple
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -71,7 +70,7 @@ class RLAgent:
         """Q-테이블 저장"""
         self.q_table_file.parent.mkdir(parents=True, exist_ok=True)
         with open(self.q_table_file, 'w') as f:
-            json.dump(self.q_table, f, indent=2)
+            json.dump(self.q_table, f, separators=(',', ':'))
 
     def _discretize_state(self, state: np.ndarray, bins: int = 5) -> str:
         """
@@ -124,12 +123,12 @@ class RLAgent:
         if not greedy and np.random.random() < self.epsilon:
             # 탐험: 무작위 행동
             action = np.random.randint(self.n_actions)
-            logger.debug(f"🎲 탐험: {self.ACTION_NAMES[action]}")
+            logger.debug("🎲 탐험: %s", self.ACTION_NAMES[action])
         else:
             # 활용: 최선의 행동
             q_values = self.get_q_values(state)
             action = int(np.argmax(q_values))
-            logger.debug(f"🎯 활용: {self.ACTION_NAMES[action]} (Q={q_values[action]:.3f})")
+            logger.debug("🎯 활용: %s (Q=%.3f)", self.ACTION_NAMES[action], q_values[action])
 
         return action
 
@@ -64,6 +64,13 @@ class Config:
     STOP_LOSS_RATE = -0.03  # -3% 절대 손절
     EMERGENCY_KOSPI_DROP = -2.0  # 코스피 -2% 시 비상 청산
 
+    # API 동시 호출 수 (스레드 풀 크기. 초당 호출 수는 아래 API_MAX_RPS로 별도 제한)
+    API_MAX_WORKERS = int(os.getenv('API_MAX_WORKERS', 8))
+    # KIS 초당 호출 한도 (실전 20건/초, 모의 2건/초) - KISApi가 모든 요청 시작 간격을 이 속도로 제한
+    API_MAX_RPS = float(os.getenv('API_MAX_RPS', 15))
+    API_RATE_LIMIT_RETRIES = 3  # 호출 한도 초과 응답 시 재시도 횟수
+    API_RATE_LIMIT_BACKOFF = 1.0  # 재시도 대기 시간 (초, 시도마다 배로 증가)
+
     # API URL
     KIS_BASE_URL = "https://openapi.koreainvestment.com:9443"
     KIS_BASE_URL_REAL = "https://openapi.koreainvestment.com:9443"
@@ -12,12 +12,18 @@
   python main.py --mode scheduler    # 자동 스케줄러 실행 (기본값)
 """
 import argparse
+import logging
 import sys
 from api import KISApi
 from trading import TradingEngine
 from scheduler import run_scheduler
 from config import Config
 
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
 
 def main():
     parser = argparse.ArgumentParser(description='한국 주식 자동매매 프로그램')
@@ -73,6 +79,8 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        api.close()
 
 
 if __name__ == '__main__':
@@ -11,10 +11,6 @@ from trading import TradingEngine
 from config import Config
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
 
@@ -136,9 +132,20 @@ class TradingScheduler:
                 time.sleep(60)  # 1분마다 체크
         except KeyboardInterrupt:
             logger.info("\n\n⏹️  자동매매 시스템 종료")
+        finally:
+            self.api.close()
 
 
 def run_scheduler():
     """스케줄러 실행 함수"""
     scheduler = TradingScheduler()
     scheduler.run()
+
+
+if __name__ == '__main__':
+    # 단독 실행(python -m scheduler.scheduler) 시에만 로깅 설정 (main.py에서 임포트할 때는 main.py 설정 사용)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    run_scheduler()
@@ -3,11 +3,36 @@
 4가지 독립적 수익원천 로직을 결합하여 최종 신호를 생성합니다.
 """
 import logging
+from bisect import bisect_right
 from typing import Dict, List
+import numpy as np
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _tug_of_war_kernel(
+    current_price: float,
+    open_price: float,
+    change_rate: float,
+    individual_buy_ratio: float,
+) -> float:
+    """
+    LOGIC 1 점수 계산 코어 (스칼라 인자만 사용)
+
+    장중 수익률 < 0 은 나눗셈 없이 현재가 < 시가 비교로 판정합니다.
+    """
+    score = 0
+    # 장중 수익률이 음수이나 전일 대비는 양수인 경우 (억눌림)
+    if open_price > 0 and current_price < open_price and change_rate > 2.0:
+        score += 60
+
+    # 개인 투자자 비중(RTP)이 높은 경우 가점 (간이 구현)
+    if individual_buy_ratio > 0.6:
+        score += 40
+
+    return min(score, 100)
+
+
 class EnsembleEngine:
     """4가지 수익원천 로직 앙상블 엔진"""
     
@@ -18,25 +43,24 @@ class EnsembleEngine:
         "news_temporal": 0.20,   # 로직 4: 정보 전파
     }
 
+    # 구간 점수표: 임계값 이상 구간마다 다음 값 (bisect/searchsorted로 조회)
+    NEWS_SPREAD_THRESHOLDS = (10, 20)
+    NEWS_SPREAD_POINTS = (0, 20, 40)
+    GRADE_THRESHOLDS = (40, 55, 70)
+    GRADE_NAMES = ("SKIP", "SMALL", "STANDARD", "TOP_PRIORITY")
+
     @staticmethod
     def calculate_logic1_tug_of_war(data: Dict) -> float:
         """
         LOGIC 1: Tug of War (30%)
         장중 가격 억눌림 + 모멘텀 유지 확인
         """
-        score = 0
-        # 장중 수익률이 음수이나 전일 대비는 양수인 경우 (억눌림)
-        intraday_ret = (data.get('current_price', 0) - data.get('open_price', 0)) / data.get('open_price', 1)
-        daily_ret = data.get('change_rate', 0) / 100
-        
-        if intraday_ret < 0 and daily_ret > 0.02:
-            score += 60
-        
-        # 개인 투자자 비중(RTP)이 높은 경우 가점 (간이 구현)
-        if data.get('individual_buy_ratio', 0) > 0.6:
-            score += 40
-            
-        return min(score, 100)
+        return _tug_of_war_kernel(
+            data.get('current_price', 0),
+            data.get('open_price', 0),
+            data.get('change_rate', 0),
+            data.get('individual_buy_ratio', 0),
+        )
 
     @staticmethod
     def calculate_logic2_v_pattern(v_score: float) -> float:
@@ -77,11 +101,10 @@ class EnsembleEngine:
         news_count = data.get('news_count', 0)
         sentiment = data.get('sentiment_score', 0) # 0~100
         
-        # 뉴스 확산성 (20개 이상)
-        if news_count >= 20:
-            score += 40
-        elif news_count >= 10:
-            score += 20
+        # 뉴스 확산성 (10개 이상 20점, 20개 이상 40점)
+        score += EnsembleEngine.NEWS_SPREAD_POINTS[
+            bisect_right(EnsembleEngine.NEWS_SPREAD_THRESHOLDS, news_count)
+        ]
             
         # 감정 분석 결과 반영
         score += (sentiment * 0.6)
@@ -103,13 +126,7 @@ class EnsembleEngine:
         )
         
         # 진입 등급 결정
-        entry_grade = "SKIP"
-        if total_score >= 70:
-            entry_grade = "TOP_PRIORITY"
-        elif total_score >= 55:
-            entry_grade = "STANDARD"
-        elif total_score >= 40:
-            entry_grade = "SMALL"
+        entry_grade = self.GRADE_NAMES[bisect_right(self.GRADE_THRESHOLDS, total_score)]
             
         return {
             "total_score": round(total_score, 1),
@@ -121,3 +138,68 @@ class EnsembleEngine:
             },
             "entry_grade": entry_grade
         }
+
+    def get_ensemble_scores(self, candidates: List[Dict]) -> List[Dict]:
+        """
+        여러 종목의 앙상블 점수를 한 번에 산출
+
+        종목별 get_ensemble_score 호출 대신 필드별 배열로 모아
+        로직 1~4와 등급 판정을 N개 종목에 대해 일괄 계산합니다.
+        결과는 종목 순서대로 get_ensemble_score와 동일합니다.
+        """
+        n = len(candidates)
+        if n == 0:
+            return []
+
+        def column(key: str, dtype=np.float64, default=0) -> np.ndarray:
+            return np.fromiter((c.get(key, default) for c in candidates), dtype=dtype, count=n)
+
+        current_price = column('current_price')
+        open_price = column('open_price')
+        sell_qty = column('sell_order_qty')
+        buy_qty = column('buy_order_qty')
+        news_count = column('news_count')
+
+        # LOGIC 1: 장중 억눌림(현재가 < 시가 & 전일 대비 +2% 초과) + 개인 비중
+        suppressed = (open_price > 0) & (current_price < open_price) & (column('change_rate') > 2.0)
+        l1 = np.minimum(60 * suppressed + 40 * (column('individual_buy_ratio') > 0.6), 100)
+        # LOGIC 2: V자 점수
+        l2 = np.minimum(column('v_score'), 100)
+        # LOGIC 3: 역설적 호가창 + 예상체결가 상승
+        paradox = (buy_qty > 0) & (sell_qty >= buy_qty * 2)
+        rising = column('expected_price_rising', dtype=bool, default=False)
+        l3 = np.minimum(70 * paradox + 30 * rising, 100)
+        # LOGIC 4: 뉴스 확산성 + 감정 점수
+        spread = np.take(
+            self.NEWS_SPREAD_POINTS,
+            np.searchsorted(self.NEWS_SPREAD_THRESHOLDS, news_count, side='right')
+        )
+        l4 = np.minimum(spread + column('sentiment_score') * 0.6, 100)
+
+        total_score = (
+            l1 * self.WEIGHTS["tug_of_war"] +
+            l2 * self.WEIGHTS["v_pattern"] +
+            l3 * self.WEIGHTS["moc_imbalance"] +
+            l4 * self.WEIGHTS["news_temporal"]
+        )
+        entry_grade = np.take(
+            self.GRADE_NAMES,
+            np.searchsorted(self.GRADE_THRESHOLDS, total_score, side='right')
+        )
+
+        return [
+            {
+                "total_score": round(total, 1),
+                "logic_scores": {
+                    "l1_tug": s1,
+                    "l2_v": s2,
+                    "l3_moc": s3,
+                    "l4_news": s4
+                },
+                "entry_grade": grade
+            }
+            for total, s1, s2, s3, s4, grade in zip(
+                total_score.tolist(), l1.tolist(), l2.tolist(),
+                l3.tolist(), l4.tolist(), entry_grade.tolist()
+            )
+        ]
@@ -9,15 +9,30 @@ import numpy as np
 from api import KISApi
 from config import Config
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _hms_to_seconds(hms: str) -> int:
+    """'HH:MM:SS' -> 자정 기준 초"""
+    h, m, s = map(int, hms.split(':'))
+    return h * 3600 + m * 60 + s
+
+
 class IntradayAnalyzer:
     """장중 실시간 분봉 분석기 (v1.1)"""
 
     def __init__(self, api: KISApi):
         self.api = api
+        # V자 감지 시간대를 초 단위로 한 번만 변환 (매 호출 strftime/문자열 비교 생략)
+        self._v_start = _hms_to_seconds(Config.V_TIME_START)
+        self._v_end = _hms_to_seconds(Config.V_TIME_END)
+
+    def in_v_window(self, now: Optional[datetime] = None) -> bool:
+        """V자 감지 시간대(15:16:00 ~ 15:19:30) 여부 (실시간 데이터 조회 전 사전 확인용)"""
+        if now is None:
+            now = datetime.now()
+        now_sec = now.hour * 3600 + now.minute * 60 + now.second
+        return self._v_start <= now_sec <= self._v_end
 
     def phase3_v_pattern(self, stock_code: str, data: Dict) -> Tuple[bool, int]:
         """
@@ -37,10 +52,8 @@ class IntradayAnalyzer:
         
         통과 기준: MUST 조건 모두 충족 (기본 50점)
         """
-        now = datetime.now().strftime('%H:%M:%S')
-        
         # MUST 1: 시간 조건
-        if not (Config.V_TIME_START <= now <= Config.V_TIME_END):
+        if not self.in_v_window():
             return False, 0
             
         current_price = data.get('current_price', 0)
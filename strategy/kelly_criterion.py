@@ -4,9 +4,9 @@
 """
 import logging
 from typing import Dict, Optional
+import numpy as np
 from config import Config
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -61,3 +61,17 @@ class KellyCriterion:
             "investment_amount": investment_amount,
             "quantity": quantity
         }
+
+    def get_position_sizes(self, total_balance: int, stock_prices, **kwargs) -> np.ndarray:
+        """
+        여러 종목의 매수 수량을 한 번에 계산 (켈리 비율은 1회만 산출)
+
+        각 종목에 get_position_size와 같은 규칙을 적용하며,
+        가격이 0 이하인 종목은 수량 0으로 처리합니다.
+        """
+        fraction = self.calculate_kelly_fraction(**kwargs)
+        investment_amount = int(total_balance * fraction)
+        prices = np.asarray(stock_prices, dtype=np.int64)
+        quantities = np.zeros(len(prices), dtype=np.int64)
+        np.floor_divide(investment_amount, prices, out=quantities, where=prices > 0)
+        return quantities
@@ -4,11 +4,10 @@ PHASE 5: 청산 로직 (익일 09:00~10:00)을 구현합니다.
 """
 import logging
 from typing import Dict, Tuple
-from datetime import datetime, time
+from datetime import datetime
 from enum import Enum
 from config import Config
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +22,74 @@ class ExitScenario(Enum):
     EMERGENCY = "EMERGENCY"
 
 
+# 시나리오별 (행동, 청산 비율) - 호출마다 표를 새로 만들지 않도록 모듈 상수로 둠
+_EXIT_ACTIONS = {
+    ExitScenario.GAP_UP_SUCCESS: ("HOLD", 0),
+    ExitScenario.GAP_UP_STRONG: ("SELL", 0.5),
+    ExitScenario.GAP_UP_WEAK: ("SELL", 1),
+    ExitScenario.FLAT_OPEN: ("HOLD", 0),
+    ExitScenario.GAP_DOWN: ("SELL", 1),
+    ExitScenario.TIMEOUT: ("SELL", 1),
+    ExitScenario.STOP_LOSS: ("SELL", 1),
+    ExitScenario.EMERGENCY: ("SELL", 1),
+}
+
+
+# _exit_kernel이 돌려주는 시나리오 코드 -> (시나리오, 사유) (손절 사유는 손익률을 붙여 호출부에서 생성)
+_KERNEL_SCENARIOS = (
+    (ExitScenario.EMERGENCY, "코스피 급락 비상청산"),
+    (ExitScenario.STOP_LOSS, None),
+    (ExitScenario.TIMEOUT, "10시 강제청산"),
+    (ExitScenario.GAP_UP_SUCCESS, "갭상승 성공, 3분 관찰"),
+    (ExitScenario.GAP_UP_STRONG, "강세 지속"),
+    (ExitScenario.GAP_UP_WEAK, "갭상승 후 약세, 청산"),
+    (ExitScenario.GAP_DOWN, "갭하락, 즉시 청산"),
+    (ExitScenario.FLAT_OPEN, "보합 출발, 방향성 관찰"),
+)
+_STOP_LOSS_CODE = 1
+_SEC_0903 = 9 * 3600 + 3 * 60
+_SEC_1000 = 10 * 3600
+
+
+def _exit_kernel(
+    entry_price: float,
+    open_price: float,
+    current_price: float,
+    now_sec: float,
+    kospi_change: float,
+    emergency_drop: float,
+    stop_loss_pct: float,
+) -> Tuple[int, float]:
+    """
+    청산 시나리오 판단 코어 (스칼라 인자만 사용)
+
+    시각은 자정 기준 초로 받아 정수/실수 비교만 수행합니다.
+    반환: (_KERNEL_SCENARIOS 인덱스, 손익률 %)
+    """
+    pnl_pct = (current_price - entry_price) / entry_price * 100
+    gap_pct = (open_price - entry_price) / entry_price * 100
+
+    # 비상 청산: 코스피 -2% 이상 하락
+    if kospi_change <= emergency_drop:
+        return 0, pnl_pct
+    # 가격 손절: -3% 이상 손실
+    if pnl_pct <= stop_loss_pct:
+        return _STOP_LOSS_CODE, pnl_pct
+    # 타임아웃: 10시 이후
+    if now_sec >= _SEC_1000:
+        return 2, pnl_pct
+    # 시나리오 A: 갭상승 (+2% 이상)
+    if gap_pct >= 2.0:
+        if now_sec <= _SEC_0903:
+            return 3, pnl_pct
+        return (4 if current_price > open_price else 5), pnl_pct
+    # 시나리오 C: 갭하락 (-1% 이상)
+    if gap_pct <= -1.0:
+        return 6, pnl_pct
+    # 시나리오 B: 보합
+    return 7, pnl_pct
+
+
 class MorningMonitor:
     """장 시작 모니터링 시스템 (v1.1)"""
 
@@ -38,51 +105,20 @@ class MorningMonitor:
         kospi_change: float
     ) -> Tuple[ExitScenario, str]:
         """청산 시나리오 판단"""
-        
         now = current_time.time()
-        pnl_pct = (current_price - entry_price) / entry_price * 100
-        gap_pct = (open_price - entry_price) / entry_price * 100
-        
-        # 비상 청산: 코스피 -2% 이상 하락
-        if kospi_change <= Config.EMERGENCY_KOSPI_DROP:
-            return ExitScenario.EMERGENCY, "코스피 급락 비상청산"
-        
-        # 가격 손절: -3% 이상 손실
-        if pnl_pct <= Config.STOP_LOSS_RATE * 100:
-            return ExitScenario.STOP_LOSS, f"손절선 도달 ({pnl_pct:.1f}%)"
-        
-        # 타임아웃: 10시 이후
-        if now >= time(10, 0):
-            return ExitScenario.TIMEOUT, "10시 강제청산"
-        
-        # 시나리오 A: 갭상승 (+2% 이상)
-        if gap_pct >= 2.0:
-            if now <= time(9, 3):
-                return ExitScenario.GAP_UP_SUCCESS, "갭상승 성공, 3분 관찰"
-            elif current_price > open_price:
-                return ExitScenario.GAP_UP_STRONG, "강세 지속"
-            else:
-                return ExitScenario.GAP_UP_WEAK, "갭상승 후 약세, 청산"
-        
-        # 시나리오 C: 갭하락 (-1% 이상)
-        if gap_pct <= -1.0:
-            return ExitScenario.GAP_DOWN, "갭하락, 즉시 청산"
-        
-        # 시나리오 B: 보합
-        return ExitScenario.FLAT_OPEN, "보합 출발, 방향성 관찰"
+        now_sec = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+        code, pnl_pct = _exit_kernel(
+            entry_price, open_price, current_price, now_sec, kospi_change,
+            Config.EMERGENCY_KOSPI_DROP, Config.STOP_LOSS_RATE * 100
+        )
+        scenario, reason = _KERNEL_SCENARIOS[code]
+        if code == _STOP_LOSS_CODE:
+            reason = f"손절선 도달 ({pnl_pct:.1f}%)"
+        return scenario, reason
 
     def execute_exit(self, scenario: ExitScenario, position_qty: int) -> Dict:
         """시나리오별 청산 실행"""
-        
-        actions = {
-            ExitScenario.GAP_UP_SUCCESS: {"action": "HOLD", "qty": 0},
-            ExitScenario.GAP_UP_STRONG: {"action": "SELL", "qty": int(position_qty * 0.5)},
-            ExitScenario.GAP_UP_WEAK: {"action": "SELL", "qty": position_qty},
-            ExitScenario.FLAT_OPEN: {"action": "HOLD", "qty": 0},
-            ExitScenario.GAP_DOWN: {"action": "SELL", "qty": position_qty},
-            ExitScenario.TIMEOUT: {"action": "SELL", "qty": position_qty},
-            ExitScenario.STOP_LOSS: {"action": "SELL", "qty": position_qty},
-            ExitScenario.EMERGENCY: {"action": "SELL", "qty": position_qty},
-        }
-        
-        return actions.get(scenario, {"action": "HOLD", "qty": 0})
+        action, ratio = _EXIT_ACTIONS.get(scenario, ("HOLD", 0))
+        if ratio == 1:
+            return {"action": action, "qty": position_qty}
+        return {"action": action, "qty": int(position_qty * ratio)}
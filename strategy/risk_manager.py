@@ -7,7 +7,6 @@ from datetime import datetime, time
 from typing import Dict, Optional
 from enum import Enum
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class RiskLevel(Enum):
@@ -22,7 +21,7 @@ class StopLossEngine:
         self.total_asset = total_asset
         self.max_loss_pct = 0.03  # 단일 거래 최대 손실 3% (총자산 기준)
 
-    def evaluate(self, data: Dict) -> Dict:
+    def evaluate(self, data: Dict, now: Optional[time] = None) -> Dict:
         """
         모든 손절 조건 종합 평가 (우선순위 순)
         1. 비상 청산 (코스피 -2%↓)
@@ -30,8 +29,11 @@ class StopLossEngine:
         3. 20일선 손절 (종가 < 20MA)
         4. 시간 손절 (09:03 시초가 미돌파)
         5. 타임아웃 (10:00 강제청산)
+
+        now: 판단 기준 시각 (보유 종목을 연달아 평가할 때 한 번만 구해서 전달)
         """
-        now = datetime.now().time()
+        if now is None:
+            now = datetime.now().time()
         
         # 1. 비상 청산
         if data.get('kospi_change', 0) <= -2.0:
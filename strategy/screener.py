@@ -3,12 +3,12 @@
 PHASE 1: 유니버스 필터 및 Tier 분류를 수행합니다.
 """
 import logging
-from typing import List, Dict, Tuple
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
 from enum import Enum
 from api import KISApi
 from config import Config
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class CandidateTier(Enum):
@@ -21,6 +21,12 @@ class StockScreener:
 
     def __init__(self, api: KISApi):
         self.api = api
+        # (분 단위 시각 'YYYY-MM-DD HH:MM', 후보 리스트): 같은 분 안의 재호출은 API 조회 생략
+        self._candidates_cache: Optional[Tuple[str, List[Dict]]] = None
+
+    def clear_cache(self):
+        """후보 캐시 초기화"""
+        self._candidates_cache = None
 
     def phase1_filter(self, stock: Dict) -> Tuple[bool, CandidateTier]:
         """
@@ -58,7 +64,15 @@ class StockScreener:
         return True, CandidateTier.TIER_3
 
     def get_candidates(self) -> List[Dict]:
-        """전체 시장에서 후보 종목 추출 및 Tier 분류"""
+        """
+        전체 시장에서 후보 종목 추출 및 Tier 분류
+
+        같은 분 안에 다시 호출되면 (재시도/대시보드 폴링 등) 직전 결과를 그대로 반환합니다.
+        """
+        minute_key = datetime.now().strftime('%Y-%m-%d %H:%M')
+        if self._candidates_cache is not None and self._candidates_cache[0] == minute_key:
+            return [dict(s) for s in self._candidates_cache[1]]
+
         logger.info("=" * 60)
         logger.info("🎯 PHASE 1: 유니버스 필터링 및 Tier 분류 시작")
         logger.info("=" * 60)
@@ -76,8 +90,18 @@ class StockScreener:
         # Tier 순 -> 거래대금 순 정렬
         candidates.sort(key=lambda x: (x['tier'].value, -x['trading_value']))
         
-        logger.info(f"✅ PHASE 1 통과 종목: {len(candidates)}개")
-        for i, s in enumerate(candidates[:10], 1):
-            logger.info(f"{i}. {s['stock_name']} ({s['stock_code']}) | Tier: {s['tier'].name} | 거래대금: {s['trading_value']/1e8:.0f}억")
-            
-        return candidates[:50]
+        logger.info("✅ PHASE 1 통과 종목: %d개", len(candidates))
+        # INFO가 꺼져 있으면 종목별 로그 포맷팅 자체를 건너뜀
+        if logger.isEnabledFor(logging.INFO):
+            for i, s in enumerate(candidates[:10], 1):
+                logger.info(
+                    "%d. %s (%s) | Tier: %s | 거래대금: %.0f억",
+                    i, s['stock_name'], s['stock_code'], s['tier'].name, s['trading_value'] / 1e8
+                )
+
+        candidates = candidates[:50]
+        # 파이프라인이 후보 딕셔너리에 점수/실시간 시세를 덧쓰므로 캐시와 반환값은 서로 다른 사본으로 유지
+        # 조회 실패(호출 한도 초과 등)로 빈 목록이 오면 캐시하지 않아 같은 분 안의 재시도가 다시 조회하도록 함
+        if raw_stocks:
+            self._candidates_cache = (minute_key, candidates)
+        return [dict(s) for s in candidates]
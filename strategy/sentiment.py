@@ -5,7 +5,6 @@ PHASE 3: 뉴스 확산성 및 감정 분석을 수행합니다.
 import logging
 from typing import Dict, List, Tuple
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class SentimentAnalyzer:
@@ -34,7 +33,7 @@ class SentimentAnalyzer:
         
         # VETO 조건 체크
         if stock.get('has_veto_news', False):
-            logger.warning(f"🚨 VETO 발생: {stock['stock_name']} 제외")
+            logger.warning("🚨 VETO 발생: %s 제외", stock['stock_name'])
             return False, 0
             
         # S1: 뉴스 확산성
@@ -82,6 +81,6 @@ class SentimentAnalyzer:
             if is_passed:
                 stock['phase3_score'] = score
                 passed_stocks.append(stock)
-                logger.info(f"✅ {stock['stock_name']} 심리적 검증 통과 | 점수: {score}")
+                logger.info("✅ %s 심리적 검증 통과 | 점수: %s", stock['stock_name'], score)
                 
         return passed_stocks
@@ -3,20 +3,186 @@
 PHASE 2: SHOULD/BONUS 점수제 기반 기술적 검증을 수행합니다.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Tuple
 import numpy as np
 from api import KISApi
 from config import Config
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+HISTORY_DAYS = 60  # 일봉 조회 기간 (60일 이평선 기준)
+
+# PHASE 2 점수 계산에 쓰는 종목 필드와 기본값 (한 번에 조회)
+_STOCK_FIELDS = ('current_price', 'high_price', 'volume', 'sector_sync')
+_STOCK_DEFAULTS = (0, 0, 0, False)
+
+# S3 고가 근접 비율 97% 를 정수 비로 보관 (원화 가격은 정수이므로 오차 없이 비교)
+_HIGH_NEAR_NUM, _HIGH_NEAR_DEN = 97, 100
+
+
+def _phase2_kernel(
+    current_price: float,
+    high_price: float,
+    vol: float,
+    sector_sync: bool,
+    is_new_high: bool,
+    is_aligned: bool,
+    vol_avg_20d: float,
+    is_long_body: bool,
+    is_short_wick: bool,
+    is_declining: bool,
+    prev_volume: float,
+) -> Tuple[bool, int]:
+    """
+    PHASE 2 점수 계산 코어 (스칼라 인자만 사용)
+
+    dict 조회와 지표 계산을 호출부로 분리한 순수 산술 함수입니다.
+    """
+    # 조건을 먼저 모두 판정한 뒤 점수는 분기 없이 합산 (bool은 0/1로 계산)
+    # S1: 20일 신고가 / S2: 이평선 정배열 (5 > 20 > 60)
+    s1 = bool(is_new_high)
+    s2 = bool(is_aligned)
+    # S3: 당일 고가 근접 (현재가 >= 고가 * 0.97)
+    s3 = high_price > 0 and current_price * _HIGH_NEAR_DEN >= high_price * _HIGH_NEAR_NUM
+
+    score = 20 * s1 + 15 * s2 + 15 * s3
+
+    # SHOULD 조건 미충족 시 탈락
+    if s1 + s2 + s3 < 2:
+        return False, score
+
+    # BONUS B1: 거래량 폭증 (20일 평균 * 3)
+    b1 = vol_avg_20d > 0 and vol >= vol_avg_20d * 3
+    # BONUS B2: 섹터 동반 상승 (외부 주입 데이터 활용)
+    b2 = bool(sector_sync)
+    # BONUS B3: 장대양봉 (몸통 3% 이상) / B4: 위꼬리 짧음 (위꼬리/몸통 <= 0.3)
+    b3 = bool(is_long_body)
+    b4 = bool(is_short_wick)
+    # BONUS B5: 눌림목 패턴 (2~3일 조정 + 5일선 지지 + 거래량 급감)
+    # 간이 구현: 직전 2일 연속 하락 & 현재가 > ma5 & 거래량 < 전일거래량 * 0.5
+    b5 = bool(is_declining) and vol < prev_volume * 0.5
+
+    score += 10 * b1 + 10 * b2 + 5 * b3 + 5 * b4 + 5 * b5
+    return True, int(score)
+
+
 class TechnicalAnalyzer:
     """기술적 분석기 (v2.0)"""
 
     def __init__(self, api: KISApi):
         self.api = api
 
+    def _get_price_history(self, stock_code: str) -> List[Dict]:
+        """
+        일봉 조회 (캐시 없이 매번 조회)
+
+        한 스캔 안에서 종목마다 한 번씩만 조회하므로 캐시로 아낄 호출이 없고,
+        장기 실행 프로세스에서 지난 일봉을 다시 쓰는 일이 없도록 보관하지 않습니다.
+        """
+        return self.api.get_daily_price_history(stock_code, HISTORY_DAYS)
+
+    @staticmethod
+    def _to_arrays(price_history: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """일봉 리스트를 (종가, 고가, 거래량) float64 배열로 한 번만 변환 (중간 리스트 없이)"""
+        n = len(price_history)
+        closes = np.fromiter((p['close'] for p in price_history), dtype=np.float64, count=n)
+        highs = np.fromiter((p['high'] for p in price_history), dtype=np.float64, count=n)
+        volumes = np.fromiter((p['volume'] for p in price_history), dtype=np.float64, count=n)
+        return closes, highs, volumes
+
+    @classmethod
+    def _compute_indicators(cls, stocks: List[Dict], histories: List[List[Dict]]) -> Dict[str, np.ndarray]:
+        """
+        N개 종목의 일봉을 (N, 최장 일봉 길이≤60) 배열로 쌓아 지표를 일괄 계산
+
+        종목별로 리스트를 만들어 np.mean/max를 반복 호출하는 대신
+        지표당 한 번의 열 단위 축소 연산으로 처리합니다.
+        조회 일수가 60일에 못 미치는 종목은 빈 칸을 NaN으로 채웁니다.
+        배열 폭은 가장 긴 일봉 길이에 맞추며, 60일을 채운 종목이 없으면
+        (신규 상장주만 모인 경우) 60일선 계산을 통째로 건너뜁니다.
+        호출부는 종목당 최소 20일 이상의 일봉을 보장해야 합니다.
+        """
+        n = len(histories)
+        lengths = np.fromiter(
+            (min(len(hist), HISTORY_DAYS) for hist in histories), dtype=np.int64, count=n
+        )
+        width = int(lengths.max())
+        closes = np.full((n, width), np.nan)
+        highs = np.full((n, width), np.nan)
+        volumes = np.full((n, width), np.nan)
+
+        for i, hist in enumerate(histories):
+            k = lengths[i]
+            closes[i, :k], highs[i, :k], volumes[i, :k] = cls._to_arrays(hist[:k])
+
+        # 누적합 한 번으로 모든 구간 평균을 뺄셈 1회 + 나눗셈 1회로 계산
+        # csum[:, k] = closes[:, :k].sum() (NaN은 조회 일수 이후에만 존재)
+        csum = np.zeros((n, width + 1))
+        np.cumsum(closes, axis=1, out=csum[:, 1:])
+        vcsum = np.zeros((n, width + 1))
+        np.nancumsum(volumes, axis=1, out=vcsum[:, 1:])
+        vol_days = np.minimum(lengths, 21) - 1
+
+        ma5 = csum[:, 5] / 5
+        ma20 = csum[:, 20] / 20
+        if width >= 60:
+            ma60 = csum[:, 60] / 60
+            is_aligned = (lengths >= 60) & (ma5 > ma20) & (ma20 > ma60)
+        else:
+            ma60 = np.full(n, np.nan)
+            is_aligned = np.zeros(n, dtype=bool)
+        past_high_20d = np.nanmax(highs[:, 1:21], axis=1)
+        has_prev = lengths >= 3
+        # 당일 시세 (현재가, 고가, 시가) 를 (N, 3) 배열 하나로 모음
+        quotes = np.fromiter(
+            (s.get(k, 0) for s in stocks for k in ('current_price', 'high_price', 'open_price')),
+            dtype=np.float64, count=n * 3
+        ).reshape(n, 3)
+        current_prices, high_prices, open_prices = quotes.T
+        body_size = np.abs(current_prices - open_prices)
+        upper_wick = high_prices - np.maximum(current_prices, open_prices)
+        body_pct = np.divide(body_size, open_prices, out=np.zeros(n), where=open_prices > 0)
+        wick_ratio = np.divide(upper_wick, body_size, out=np.full(n, np.inf), where=body_size > 0)
+
+        # SHOULD 판정도 종목 루프 밖에서 N개를 한 번에 처리
+        return {
+            "closes": closes,
+            "volumes": volumes,
+            "lengths": lengths,
+            "ma5": ma5,
+            "ma20": ma20,
+            "ma60": ma60,
+            "vol_avg_20d": (vcsum[:, min(width, 21)] - vcsum[:, 1]) / vol_days,
+            "is_new_high": high_prices >= past_high_20d,
+            "is_aligned": is_aligned,
+            # B3 장대양봉 / B4 위꼬리 짧음
+            "is_long_body": (open_prices > 0) & (current_prices > open_prices) & (body_pct >= 0.03),
+            "is_short_wick": wick_ratio <= 0.3,
+            # B5 눌림목: 전일 종가 < 전전일 종가 (직전 하락 여부)
+            "is_declining": has_prev & (closes[:, 1] < closes[:, 2]),
+            "prev_volume": np.where(has_prev, volumes[:, 1], 0.0),
+        }
+
+    def _score(self, stock: Dict, ind: Dict, i: int) -> Tuple[bool, int]:
+        """사전 계산된 지표(ind의 i번째 행)로 PHASE 2 점수 산출"""
+        current_price, high_price, vol, sector_sync = map(
+            stock.get, _STOCK_FIELDS, _STOCK_DEFAULTS
+        )
+        return _phase2_kernel(
+            current_price,
+            high_price,
+            vol,
+            bool(sector_sync),
+            bool(ind['is_new_high'][i]),
+            bool(ind['is_aligned'][i]),
+            float(ind['vol_avg_20d'][i]),
+            bool(ind['is_long_body'][i]),
+            bool(ind['is_short_wick'][i]),
+            bool(ind['is_declining'][i]),
+            float(ind['prev_volume'][i]),
+        )
+
     def phase2_score(self, stock: Dict) -> Tuple[bool, int]:
         """
         PHASE 2: 기술적 검증 (점수제)
@@ -33,91 +199,52 @@ class TechnicalAnalyzer:
         - B4: 위꼬리 짧음 (5점)
         - B5: 눌림목 패턴 (5점)
         """
-        score = 0
-        should_count = 0
-        stock_code = stock['stock_code']
-        
         # 데이터 조회
-        price_history = self.api.get_daily_price_history(stock_code, 60)
+        price_history = self._get_price_history(stock['stock_code'])
         if not price_history or len(price_history) < 20:
             return False, 0
-            
-        current_price = stock.get('current_price', 0)
-        high_price = stock.get('high_price', 0)
-        open_price = stock.get('open_price', 0)
-        
-        # S1: 20일 신고가
-        past_high_20d = max([p['high'] for p in price_history[1:21]])
-        if high_price >= past_high_20d:
-            score += 20
-            should_count += 1
-            
-        # S2: 이평선 정배열 (5 > 20 > 60)
-        if len(price_history) >= 60:
-            closes = [p['close'] for p in price_history]
-            ma5 = np.mean(closes[:5])
-            ma20 = np.mean(closes[:20])
-            ma60 = np.mean(closes[:60])
-            if ma5 > ma20 > ma60:
-                score += 15
-                should_count += 1
-            
-        # S3: 당일 고가 근접 (현재가 >= 고가 * 0.97)
-        if high_price > 0 and current_price >= high_price * 0.97:
-            score += 15
-            should_count += 1
-            
-        # SHOULD 조건 미충족 시 탈락
-        if should_count < 2:
-            return False, score
-            
-        # BONUS B1: 거래량 폭증 (20일 평균 * 3)
-        vol = stock.get('volume', 0)
-        vol_avg_20d = np.mean([p['volume'] for p in price_history[1:21]])
-        if vol_avg_20d > 0 and vol >= vol_avg_20d * 3:
-            score += 10
-            
-        # BONUS B2: 섹터 동반 상승 (외부 주입 데이터 활용)
-        if stock.get('sector_sync', False):
-            score += 10
-            
-        # BONUS B3: 장대양봉 (몸통 3% 이상)
-        body_pct = abs(current_price - open_price) / open_price if open_price > 0 else 0
-        if body_pct >= 0.03 and current_price > open_price:
-            score += 5
-            
-        # BONUS B4: 위꼬리 짧음 (위꼬리/몸통 <= 0.3)
-        body_size = abs(current_price - open_price)
-        upper_wick = high_price - max(current_price, open_price)
-        if body_size > 0 and (upper_wick / body_size) <= 0.3:
-            score += 5
-            
-        # BONUS B5: 눌림목 패턴 (2~3일 조정 + 5일선 지지 + 거래량 급감)
-        # 간이 구현: 직전 2일 연속 하락 & 현재가 > ma5 & 거래량 < 전일거래량 * 0.5
-        if len(price_history) >= 3:
-            is_declining = price_history[1]['close'] < price_history[2]['close']
-            vol_drop = vol < price_history[1]['volume'] * 0.5
-            if is_declining and vol_drop:
-                score += 5
-            
-        return True, score
+
+        ind = self._compute_indicators([stock], [price_history])
+        return self._score(stock, ind, 0)
 
     def analyze_candidates(self, candidates: List[Dict]) -> List[Dict]:
         """후보 종목들에 대해 기술적 분석 수행"""
         logger.info("=" * 60)
         logger.info("🔬 PHASE 2: 기술적 검증 시작")
         logger.info("=" * 60)
-        
+
+        # 일봉을 먼저 모두 조회한 뒤 지표를 한 번에 계산
+        # (API 대기 시간이 대부분이므로 스레드 풀로 동시 조회)
+        with ThreadPoolExecutor(max_workers=Config.API_MAX_WORKERS) as executor:
+            fetched = list(executor.map(
+                self._get_price_history, [s['stock_code'] for s in candidates]
+            ))
+
+        stocks, histories = [], []
+        for stock, price_history in zip(candidates, fetched):
+            if price_history and len(price_history) >= 20:
+                stocks.append(stock)
+                histories.append(price_history)
+            elif price_history:
+                logger.info("ℹ️ %s 일봉 %d일 (20일 미만) - PHASE 2 제외", stock['stock_name'], len(price_history))
+            else:
+                # 조회 실패(호출 한도 초과 재시도 소진 등)로 빈 결과면 조용히 탈락하지 않도록 기록
+                logger.warning("⚠️ %s 일봉 조회 실패 - PHASE 2 제외", stock['stock_name'])
+
         passed_stocks = []
-        for stock in candidates:
-            is_passed, score = self.phase2_score(stock)
-            if is_passed:
-                stock['phase2_score'] = score
-                passed_stocks.append(stock)
-                logger.info(f"✅ {stock['stock_name']} 통과 | 점수: {score}")
+        if stocks:
+            ind = self._compute_indicators(stocks, histories)
+            for i, stock in enumerate(stocks):
+                is_passed, score = self._score(stock, ind, i)
+                if is_passed:
+                    stock['phase2_score'] = score
+                    passed_stocks.append(stock)
+                    logger.info("✅ %s 통과 | 점수: %s", stock['stock_name'], score)
                 
-        # 점수 순 정렬
-        passed_stocks.sort(key=lambda x: x['phase2_score'], reverse=True)
+        # 점수 순 정렬 (동점은 기존 순서 유지)
+        scores = np.fromiter((s['phase2_score'] for s in passed_stocks), dtype=np.int32, count=len(passed_stocks))
+        order = np.argsort(-scores, kind='stable')
+        passed_stocks = [passed_stocks[i] for i in order]
         
-        logger.info(f"✅ PHASE 2 통과 종목: {len(passed_stocks)}개")
+        logger.info("✅ PHASE 2 통과 종목: %d개", len(passed_stocks))
         return passed_stocks
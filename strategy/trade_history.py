@@ -9,7 +9,6 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -17,21 +16,77 @@ class TradeHistory:
     """거래 실적 추적기"""
 
     def __init__(self):
-        self.history_file = Path(__file__).parent.parent / "data" / "trade_history.json"
+        data_dir = Path(__file__).parent.parent / "data"
+        # 거래 1건당 한 줄씩 추가하는 JSON Lines 형식
+        self.history_file = data_dir / "trade_history.jsonl"
+        self.legacy_history_file = data_dir / "trade_history.json"
         self.history = self._load_history()
+        self._rebuild_aggregates()
 
     def _load_history(self) -> List[Dict]:
         """거래 기록 로드"""
         if self.history_file.exists():
             with open(self.history_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                return [json.loads(line) for line in f if line.strip()]
+
+        # 이전 형식(JSON 배열) 파일이 있으면 JSONL로 한 번 변환
+        if self.legacy_history_file.exists():
+            with open(self.legacy_history_file, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+            self._save_history(history)
+            return history
         return []
 
-    def _save_history(self):
-        """거래 기록 저장"""
+    def _save_history(self, history: List[Dict]):
+        """거래 기록 전체 저장 (형식 변환/초기화 시에만 사용)"""
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
         with open(self.history_file, 'w', encoding='utf-8') as f:
-            json.dump(self.history, f, ensure_ascii=False, indent=2)
+            for trade in history:
+                f.write(json.dumps(trade, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def _append_history(self, trade: Dict):
+        """거래 1건을 파일 끝에 추가 (기존 기록은 다시 쓰지 않음)"""
+        # 디렉터리는 실제로 기록할 때 확인 (생성자는 파일시스템을 건드리지 않고, 중간에 지워져도 복구)
+        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.history_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(trade, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    @staticmethod
+    def _new_aggregates() -> Dict:
+        """누적 통계 초기값"""
+        return {
+            "count": 0,
+            "win_count": 0,
+            "profit_rate_sum": 0.0,
+            "win_rate_sum": 0.0,
+            "loss_rate_sum": 0.0,
+            "total_profit": 0,
+            "max_profit": None,
+            "max_loss": None,
+        }
+
+    @staticmethod
+    def _accumulate(agg: Dict, trade: Dict):
+        """거래 1건을 누적 통계에 반영"""
+        profit_rate = trade['profit_rate']
+        profit = trade['profit']
+
+        agg['count'] += 1
+        agg['profit_rate_sum'] += profit_rate
+        if profit_rate > 0:
+            agg['win_count'] += 1
+            agg['win_rate_sum'] += profit_rate
+        else:
+            agg['loss_rate_sum'] += profit_rate
+        agg['total_profit'] += profit
+        agg['max_profit'] = profit if agg['max_profit'] is None else max(agg['max_profit'], profit)
+        agg['max_loss'] = profit if agg['max_loss'] is None else min(agg['max_loss'], profit)
+
+    def _rebuild_aggregates(self):
+        """전체 거래 기록으로 누적 통계 재계산 (로드/초기화 시 1회)"""
+        self._aggregates = self._new_aggregates()
+        for trade in self.history:
+            self._accumulate(self._aggregates, trade)
 
     def add_trade(self, trade: Dict):
         """
@@ -51,11 +106,12 @@ class TradeHistory:
         """
         trade['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         self.history.append(trade)
-        self._save_history()
+        self._accumulate(self._aggregates, trade)
+        self._append_history(trade)
 
         logger.info(
-            f"📝 거래 기록 추가: {trade['stock_name']} "
-            f"수익률 {trade['profit_rate']:+.2f}% (총 {len(self.history)}건)"
+            "📝 거래 기록 추가: %s 수익률 %+.2f%% (총 %d건)",
+            trade['stock_name'], trade['profit_rate'], len(self.history)
         )
 
     def get_statistics(self, recent_trades: Optional[int] = None) -> Dict:
@@ -68,56 +124,29 @@ class TradeHistory:
         Returns:
             통계 딕셔너리
         """
-        if not self.history:
-            return {
-                "total_trades": 0,
-                "win_trades": 0,
-                "lose_trades": 0,
-                "win_rate": 0.0,
-                "avg_profit_rate": 0.0,
-                "avg_win_rate": 0.0,
-                "avg_loss_rate": 0.0,
-                "total_profit": 0,
-                "max_profit": 0,
-                "max_loss": 0,
-            }
-
-        # 최근 N개 거래만 분석
-        trades = self.history[-recent_trades:] if recent_trades else self.history
-
-        total_trades = len(trades)
-        win_trades = [t for t in trades if t['profit_rate'] > 0]
-        lose_trades = [t for t in trades if t['profit_rate'] <= 0]
-
-        win_count = len(win_trades)
-        lose_count = len(lose_trades)
-        win_rate = win_count / total_trades if total_trades > 0 else 0
-
-        # 평균 수익률
-        avg_profit_rate = sum(t['profit_rate'] for t in trades) / total_trades if total_trades > 0 else 0
-
-        # 평균 수익/손실률
-        avg_win_rate = sum(t['profit_rate'] for t in win_trades) / win_count if win_count > 0 else 0
-        avg_loss_rate = sum(t['profit_rate'] for t in lose_trades) / lose_count if lose_count > 0 else 0
-
-        # 총 수익
-        total_profit = sum(t['profit'] for t in trades)
-
-        # 최대 수익/손실
-        max_profit = max((t['profit'] for t in trades), default=0)
-        max_loss = min((t['profit'] for t in trades), default=0)
+        # 전체 통계는 add_trade에서 갱신한 누적값을 그대로 사용 (O(1))
+        if recent_trades:
+            agg = self._new_aggregates()
+            for trade in self.history[-recent_trades:]:
+                self._accumulate(agg, trade)
+        else:
+            agg = self._aggregates
+
+        total_trades = agg['count']
+        win_count = agg['win_count']
+        lose_count = total_trades - win_count
 
         return {
             "total_trades": total_trades,
             "win_trades": win_count,
             "lose_trades": lose_count,
-            "win_rate": win_rate,
-            "avg_profit_rate": avg_profit_rate,
-            "avg_win_rate": avg_win_rate,
-            "avg_loss_rate": avg_loss_rate,
-            "total_profit": total_profit,
-            "max_profit": max_profit,
-            "max_loss": max_loss,
+            "win_rate": win_count / total_trades if total_trades > 0 else 0.0,
+            "avg_profit_rate": agg['profit_rate_sum'] / total_trades if total_trades > 0 else 0.0,
+            "avg_win_rate": agg['win_rate_sum'] / win_count if win_count > 0 else 0.0,
+            "avg_loss_rate": agg['loss_rate_sum'] / lose_count if lose_count > 0 else 0.0,
+            "total_profit": agg['total_profit'],
+            "max_profit": agg['max_profit'] if agg['max_profit'] is not None else 0,
+            "max_loss": agg['max_loss'] if agg['max_loss'] is not None else 0,
         }
 
     def print_statistics(self, recent_trades: Optional[int] = None):
@@ -160,5 +189,6 @@ class TradeHistory:
     def clear_history(self):
         """모든 거래 기록 삭제"""
         self.history = []
-        self._save_history()
+        self._rebuild_aggregates()
+        self._save_history(self.history)
         logger.warning("⚠️  모든 거래 기록이 삭제되었습니다.")
@@ -3,11 +3,11 @@ v1.1 전략 로직 테스트 스크립트
 """
 import unittest
 from datetime import datetime
+from unittest.mock import patch
 from strategy.screener import StockScreener
 from strategy.technical import TechnicalAnalyzer
 from strategy.intraday_analysis import IntradayAnalyzer
 from strategy.morning_monitor import MorningMonitor, ExitScenario
-from config import Config
 
 class MockAPI:
     def get_top_trading_value(self, count):
@@ -55,12 +55,14 @@ class MockAPI:
         }
 
 class TestV11Strategy(unittest.TestCase):
-    def setUp(self):
-        self.api = MockAPI()
-        self.screener = StockScreener(self.api)
-        self.technical = TechnicalAnalyzer(self.api)
-        self.intraday = IntradayAnalyzer(self.api)
-        self.morning = MorningMonitor()
+    @classmethod
+    def setUpClass(cls):
+        # 분석기는 상태가 없거나 캐시만 가지므로 클래스 단위로 한 번만 생성
+        cls.api = MockAPI()
+        cls.screener = StockScreener(cls.api)
+        cls.technical = TechnicalAnalyzer(cls.api)
+        cls.intraday = IntradayAnalyzer(cls.api)
+        cls.morning = MorningMonitor()
 
     def test_phase1_filter(self):
         candidates = self.screener.get_candidates()
@@ -79,17 +81,31 @@ class TestV11Strategy(unittest.TestCase):
         self.assertTrue(is_passed)
         self.assertGreaterEqual(score, 35)
 
+    def test_phase2_batch_matches_single(self):
+        stock = {
+            "stock_code": "005930",
+            "stock_name": "삼성전자",
+            "current_price": 75000,
+            "high_price": 75500,
+            "volume": 10000000
+        }
+        _, single_score = self.technical.phase2_score(dict(stock))
+        passed = self.technical.analyze_candidates([dict(stock), dict(stock, stock_code="000660")])
+        self.assertEqual(len(passed), 2)
+        self.assertTrue(all(s['phase2_score'] == single_score for s in passed))
+
     def test_phase3_v_pattern(self):
-        # 시간을 15:17로 고정하여 테스트하기 위해 Config를 임시로 수정하거나 
-        # datetime.now()를 모킹해야 함. 여기서는 로직 흐름만 확인.
         data = self.api.get_realtime_analysis_data("005930")
-        # 현재 시간이 V_TIME_START ~ V_TIME_END 사이여야 함
-        import datetime as dt
-        now_str = dt.datetime.now().strftime('%H:%M:%S')
-        if Config.V_TIME_START <= now_str <= Config.V_TIME_END:
+        # V_TIME_START ~ V_TIME_END 사이(15:17)로 시각을 고정
+        with patch('strategy.intraday_analysis.datetime') as mock_dt:
+            mock_dt.now.return_value = datetime(2024, 1, 2, 15, 17, 0)
             is_passed, score = self.intraday.phase3_v_pattern("005930", data)
-            self.assertTrue(is_passed)
-            self.assertEqual(score, 70) # 50(base) + 10(exec_str) + 10(orderbook)
+        self.assertTrue(is_passed)
+        self.assertEqual(score, 65) # 50(base) + 10(orderbook) + 5(20MA)
+
+        with patch('strategy.intraday_analysis.datetime') as mock_dt:
+            mock_dt.now.return_value = datetime(2024, 1, 2, 15, 20, 0)
+            self.assertEqual(self.intraday.phase3_v_pattern("005930", data), (False, 0))
 
     def test_phase5_exit(self):
         scenario, reason = self.morning.determine_exit_scenario(
@@ -1,11 +1,21 @@
 """
 v2.0 시스템 통합 테스트 스크립트
 """
+import json
+import tempfile
 import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+import numpy as np
+from api import KISApi
 from strategy.ensemble import EnsembleEngine
 from strategy.risk_manager import StopLossEngine, MacroFilter, RiskLevel
 from strategy.screener import StockScreener, CandidateTier
+from strategy.kelly_criterion import KellyCriterion
 from command_center.command_center import CommandCenter
+from trading.engine import TradingEngine
+from config import Config
 
 class MockAPI:
     def get_top_trading_value(self, count):
@@ -24,12 +34,13 @@ class MockAPI:
         return {"cash": 10000000}
 
 class TestV20System(unittest.TestCase):
-    def setUp(self):
-        self.api = MockAPI()
-        self.ensemble = EnsembleEngine()
-        self.risk = StopLossEngine(total_asset=100000000)
-        self.macro = MacroFilter()
-        self.commander = CommandCenter(self.api)
+    @classmethod
+    def setUpClass(cls):
+        cls.api = MockAPI()
+        cls.ensemble = EnsembleEngine()
+        cls.risk = StopLossEngine(total_asset=100000000)
+        cls.macro = MacroFilter()
+        cls.commander = CommandCenter(cls.api)
 
     def test_ensemble_logic(self):
         data = {
@@ -46,6 +57,25 @@ class TestV20System(unittest.TestCase):
         self.assertGreaterEqual(res['total_score'], 70)
         self.assertEqual(res['entry_grade'], "TOP_PRIORITY")
 
+    def test_ensemble_batch_matches_single(self):
+        candidates = [
+            {"current_price": 75000, "open_price": 76000, "change_rate": 3.0, "v_score": 80,
+             "sell_order_qty": 20000, "buy_order_qty": 10000, "news_count": 25, "sentiment_score": 70},
+            {"current_price": 50000, "open_price": 49000, "change_rate": 1.0, "v_score": 120,
+             "individual_buy_ratio": 0.7, "expected_price_rising": True, "news_count": 12},
+            {},
+        ]
+        batch = self.ensemble.get_ensemble_scores(candidates)
+        self.assertEqual(batch, [self.ensemble.get_ensemble_score(c) for c in candidates])
+
+    def test_kelly_batch_matches_single(self):
+        kelly = KellyCriterion()
+        prices = [75000, 12345, 0]
+        sizes = kelly.get_position_sizes(10000000, prices)
+        self.assertEqual(sizes[0], kelly.get_position_size(10000000, 75000)['quantity'])
+        self.assertEqual(sizes[1], kelly.get_position_size(10000000, 12345)['quantity'])
+        self.assertEqual(sizes[2], 0)
+
     def test_macro_filter(self):
         data = {"kospi_change": -1.5, "us_futures_change": -0.5, "vix": 20}
         res = self.macro.check_market_regime(data)
@@ -56,6 +86,11 @@ class TestV20System(unittest.TestCase):
         screener = StockScreener(self.api)
         candidates = screener.get_candidates()
         self.assertEqual(candidates[0]['tier'], CandidateTier.TIER_1)
+        # 같은 분 재호출은 캐시를 쓰되, 앞선 호출 결과를 고쳐도 영향을 받지 않아야 함
+        candidates[0]['current_price'] = 1
+        again = screener.get_candidates()
+        self.assertIsNot(again[0], candidates[0])
+        self.assertNotIn('current_price', again[0])
 
     def test_commander_decision(self):
         candidates = [{
@@ -75,5 +110,99 @@ class TestV20System(unittest.TestCase):
         self.assertEqual(len(decisions), 1)
         self.assertEqual(decisions[0]['grade'], "TOP_PRIORITY")
 
+    def test_second_buy_merges_holding(self):
+        holdings = {}
+        TradingEngine._add_holding(holdings, "005930", "삼성전자", 70000, 10, "20261015")
+        TradingEngine._add_holding(holdings, "005930", "삼성전자", 76000, 20, "20261016")
+        held = holdings["005930"]
+        self.assertEqual(len(holdings), 1)
+        self.assertEqual(held['quantity'], 30)
+        self.assertEqual(held['buy_price'], 74000)
+        self.assertEqual(held['buy_date'], "20261016")
+
+    def test_api_retries_rate_limited_request(self):
+        api = KISApi()
+        limited = mock.Mock(status_code=429, ok=False)
+        ok = mock.Mock(status_code=200, ok=True)
+        api.session = mock.Mock()
+        api.session.request.side_effect = [limited, ok]
+        with mock.patch.object(Config, 'API_RATE_LIMIT_BACKOFF', 0):
+            self.assertIs(api._request("GET", "http://kis/test"), ok)
+        self.assertEqual(api.session.request.call_count, 2)
+
+class TestClosingPipeline(unittest.TestCase):
+    """run_full_pipeline 종단 테스트 (API/분석기는 모두 목으로 대체)"""
+
+    IN_WINDOW = datetime(2026, 10, 16, 15, 18)
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.api = mock.Mock()
+        self.api.get_balance.return_value = {"cash": 1000000}
+        self.api.place_order.return_value = True
+
+        self.engine = TradingEngine(self.api)
+        self.engine.portfolio_file = Path(tmp.name) / "portfolio.json"
+        self.engine._portfolio_mtime = None
+        self.engine.portfolio = {"holdings": {}}
+
+        candidates = [{"stock_code": "000001"}, {"stock_code": "000002"}]
+        self.engine.screener = mock.Mock(**{"get_candidates.return_value": candidates})
+        self.engine.sentiment = mock.Mock(**{"analyze_psychology.side_effect": lambda c: c})
+        self.engine.technical = mock.Mock(**{"analyze_candidates.side_effect": lambda c: c})
+        self.engine.intraday = mock.Mock(**{
+            "in_v_window.return_value": True,
+            "get_realtime_data.return_value": {},
+            "phase3_v_pattern.return_value": (True, 60),
+        })
+        self.engine.command_center = mock.Mock(**{"get_final_decision.return_value": [
+            {"symbol": "000001", "name": "A", "price": 100000, "multiplier": 1.0},
+            {"symbol": "000002", "name": "B", "price": 100000, "multiplier": 1.0},
+        ]})
+        self.engine.kelly = mock.Mock(**{"get_position_sizes.return_value": np.array([8, 5])})
+
+    def _run(self, now):
+        fake_datetime = mock.Mock(wraps=datetime, **{"now.return_value": now})
+        with mock.patch("trading.engine.datetime", fake_datetime):
+            self.engine.run_full_pipeline()
+
+    def _saved_holdings(self):
+        return json.loads(self.engine.portfolio_file.read_bytes())['holdings']
+
+    def test_outside_buy_window_skips_everything(self):
+        self._run(datetime(2026, 10, 16, 10, 0))
+        self.engine.screener.get_candidates.assert_not_called()
+        self.api.place_order.assert_not_called()
+
+    def test_cash_is_reserved_across_orders(self):
+        self._run(self.IN_WINDOW)
+        # A가 8주(80만원)를 쓰고 남은 20만원으로 B는 켈리 5주 대신 2주만 매수
+        orders = sorted(c.args[:2] for c in self.api.place_order.call_args_list)
+        self.assertEqual(orders, [("000001", 8), ("000002", 2)])
+        self.api.get_balance.assert_called_once()
+
+    def test_failed_order_is_not_recorded(self):
+        self.api.place_order.side_effect = lambda code, qty, price, order_type: code == "000001"
+        self._run(self.IN_WINDOW)
+        holdings = self._saved_holdings()
+        self.assertEqual(list(holdings), ["000001"])
+        self.assertEqual(holdings["000001"]['quantity'], 8)
+
+    def test_concurrent_portfolio_change_is_kept(self):
+        other = {"stock_code": "999999", "stock_name": "C", "buy_price": 5000, "quantity": 3, "buy_date": "20261015"}
+
+        def write_from_other_process(*args):
+            # 분석 도중 다른 프로세스가 portfolio.json을 기록한 상황
+            self.engine.portfolio_file.write_text(json.dumps({"holdings": {"999999": other}}))
+            return self.engine.command_center.get_final_decision.return_value
+
+        self.engine.command_center.get_final_decision.side_effect = write_from_other_process
+        self._run(self.IN_WINDOW)
+        holdings = self._saved_holdings()
+        self.assertEqual(holdings["999999"], other)
+        self.assertEqual(holdings["000001"]['quantity'], 8)
+        self.assertEqual(holdings["000002"]['quantity'], 2)
+
 if __name__ == "__main__":
     unittest.main()
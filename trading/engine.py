@@ -4,8 +4,11 @@
 """
 import logging
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List, Tuple
 from api import KISApi
 from strategy.screener import StockScreener
 from strategy.technical import TechnicalAnalyzer
@@ -16,9 +19,19 @@ from strategy.kelly_criterion import KellyCriterion
 from command_center.command_center import CommandCenter
 from config import Config
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _hhmm_to_minutes(hhmm: str) -> int:
+    """'HH:MM' -> 자정 기준 분"""
+    h, m = map(int, hhmm.split(':'))
+    return h * 60 + m
+
+
+# 매수 시간대를 임포트 시 분 단위 정수로 한 번만 변환 (매 호출 strftime/문자열 비교 생략)
+_BUY_START_MIN = _hhmm_to_minutes(Config.BUY_TIME_START)
+_BUY_END_MIN = _hhmm_to_minutes(Config.BUY_TIME_END)
+
 class TradingEngine:
     """매매 엔진 (v2.0)"""
 
@@ -35,34 +48,138 @@ class TradingEngine:
         self.command_center = CommandCenter(api)
 
         self.portfolio_file = Path("/home/ubuntu/gpt/data/portfolio.json")
+        # 마지막으로 읽거나 쓴 시점의 파일 mtime (같으면 다시 읽지 않음)
+        self._portfolio_mtime = None
         self.portfolio = self._load_portfolio()
+        # 루프 안에서는 변경 표시만 하고, 메서드 끝에서 한 번만 저장
+        self._portfolio_dirty = False
 
     def _load_portfolio(self):
+        """포트폴리오 로드 (holdings: 종목코드 -> 보유 정보)"""
         if self.portfolio_file.exists():
-            with open(self.portfolio_file, 'r') as f:
-                return json.load(f)
-        return {"holdings": []}
+            self._portfolio_mtime = self.portfolio_file.stat().st_mtime_ns
+            # 바이트로 한 번에 읽어 디코딩 (json.loads가 UTF-8 바이트를 직접 처리)
+            portfolio = json.loads(self.portfolio_file.read_bytes())
+            holdings = portfolio.get('holdings', {})
+            # 이전 형식(보유 정보 리스트)은 종목코드 키 딕셔너리로 변환
+            if isinstance(holdings, list):
+                holdings = {h['stock_code']: h for h in holdings}
+            portfolio['holdings'] = holdings
+            return portfolio
+        return {"holdings": {}}
+
+    def _refresh_portfolio(self):
+        """다른 프로세스(스케줄러/CLI)가 파일을 바꾼 경우에만 다시 로드"""
+        try:
+            mtime = self.portfolio_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime != self._portfolio_mtime:
+            self.portfolio = self._load_portfolio()
+
+    def _save_portfolio(self):
+        """변경된 경우에만 포트폴리오 저장 (임시 파일에 쓴 뒤 교체해 중간에 끊겨도 파일이 깨지지 않음)"""
+        if not self._portfolio_dirty:
+            return
+        # 디렉터리는 실제로 저장할 때만 생성 (엔진 생성만으로는 파일시스템을 건드리지 않음)
+        self.portfolio_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.portfolio_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(
+            json.dumps(self.portfolio, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        )
+        os.replace(tmp_file, self.portfolio_file)
+        self._portfolio_dirty = False
+        self._portfolio_mtime = self.portfolio_file.stat().st_mtime_ns
+
+    @staticmethod
+    def _add_holding(holdings: Dict, stock_code: str, stock_name: str,
+                     price: int, quantity: int, buy_date: str):
+        """
+        매수 체결분을 보유 기록에 반영
+
+        이미 보유 중인 종목이면 수량을 합치고 매수가는 수량 가중 평균으로 갱신합니다
+        (기존 보유분이 덮어써져 청산 대상에서 빠지지 않도록).
+        """
+        held = holdings.get(stock_code)
+        if held is None:
+            holdings[stock_code] = {
+                "stock_code": stock_code,
+                "stock_name": stock_name,
+                "buy_price": price,
+                "quantity": quantity,
+                "buy_date": buy_date,
+            }
+            return
+        total_qty = held['quantity'] + quantity
+        held['buy_price'] = (held['buy_price'] * held['quantity'] + price * quantity) / total_qty
+        held['quantity'] = total_qty
+        held['buy_date'] = buy_date
+
+    def _place_orders(self, orders: List[Tuple[str, int]], order_type: str) -> List[bool]:
+        """
+        (종목코드, 수량) 주문들을 동시에 제출하고 성공 여부를 같은 순서로 반환
+
+        종목별 주문은 서로 독립이므로 브로커 왕복 시간을 겹쳐 마감 시각 전에 끝내기 위함
+        (동시 요청 수는 API_MAX_WORKERS, 초당 요청 수는 KISApi 공통 제한(API_MAX_RPS)을 따르며
+        한도 초과로 거절된 주문은 KISApi가 재시도하므로 버스트로 주문이 유실되지 않음)
+        """
+        if not orders:
+            return []
+        with ThreadPoolExecutor(max_workers=Config.API_MAX_WORKERS) as executor:
+            return list(executor.map(
+                lambda order: self.api.place_order(order[0], order[1], 0, order_type), orders
+            ))
 
     def run_full_pipeline(self):
         """v2.0 5단계 전략 파이프라인 실행"""
+        # 매수 시간대가 아니면 스크리닝/분석 API 호출 전에 바로 종료
+        # (이 시각을 한 사이클의 기준 시각으로 삼아 보유 기록의 매수일에도 사용)
+        now = datetime.now()
+        if not (_BUY_START_MIN <= now.hour * 60 + now.minute <= _BUY_END_MIN):
+            logger.info(
+                "⏰ 매수 시간대(%s~%s)가 아닙니다: %02d:%02d",
+                Config.BUY_TIME_START, Config.BUY_TIME_END, now.hour, now.minute
+            )
+            return
+
+        # 보유 종목 수가 한도에 도달했으면 어떤 후보도 매수할 수 없으므로 분석 전에 종료
+        self._refresh_portfolio()
+        open_slots = Config.MAX_STOCKS - len(self.portfolio['holdings'])
+        if open_slots <= 0:
+            logger.info("📦 보유 종목 한도(%d) 도달 — 신규 진입 생략", Config.MAX_STOCKS)
+            return
+
         logger.info("🚀 v2.0 종가베팅 파이프라인 가동")
         
         # 1. PHASE 1: 유니버스 필터 (Tier 분류)
         candidates = self.screener.get_candidates()
         if not candidates: return
 
-        # 2. PHASE 2: 기술적 검증 (SHOULD/BONUS)
-        tech_passed = self.technical.analyze_candidates(candidates)
-        if not tech_passed: return
-
-        # 3. PHASE 3: 심리적 검증 (뉴스/감정)
-        psych_passed = self.sentiment.analyze_psychology(tech_passed)
+        # 2~3. 심리적 검증(PHASE 3)을 기술적 검증(PHASE 2)보다 먼저 수행
+        # PHASE 3은 API 호출 없는 점수 계산으로 VETO 등 탈락이 많고, PHASE 2는 종목마다
+        # 일봉 조회가 필요하므로 싼 필터로 먼저 걸러 조회 수를 줄임
+        # (두 단계 모두 종목별 독립 판정이고 PHASE 2가 점수 순으로 안정 정렬하므로 결과는 동일)
+        psych_passed = self.sentiment.analyze_psychology(candidates)
         if not psych_passed: return
 
+        tech_passed = self.technical.analyze_candidates(psych_passed)
+        if not tech_passed: return
+
         # 4. PHASE 4: V자 반등 및 앙상블 최종 결정
+        # V자 감지 시간대 밖이면 어떤 종목도 통과할 수 없으므로 실시간 조회 자체를 생략
+        if not self.intraday.in_v_window():
+            logger.info("⏰ V자 감지 시간대(%s~%s)가 아닙니다", Config.V_TIME_START, Config.V_TIME_END)
+            return
+
+        # 종목별 실시간 데이터 조회는 서로 독립이므로 스레드 풀로 동시에 수행
+        # (초당 호출 수는 KISApi 공통 제한(API_MAX_RPS)이 스레드 간에 함께 적용)
+        with ThreadPoolExecutor(max_workers=Config.API_MAX_WORKERS) as executor:
+            realtime_batch = list(executor.map(
+                self.intraday.get_realtime_data, [s['stock_code'] for s in tech_passed]
+            ))
+
         final_candidates = []
-        for stock in psych_passed:
-            realtime_data = self.intraday.get_realtime_data(stock['stock_code'])
+        for stock, realtime_data in zip(tech_passed, realtime_batch):
             is_v_passed, v_score = self.intraday.phase3_v_pattern(stock['stock_code'], realtime_data)
             if is_v_passed:
                 stock['v_score'] = v_score
@@ -81,38 +198,91 @@ class TradingEngine:
         }
 
         # Commander 최종 결정
+        # 잔고는 한 번만 조회하고, 이후 매수분은 지역 변수에서 차감 (주문마다 API 재조회 생략)
+        account_info = self.api.get_balance()
         decisions = self.command_center.get_final_decision(
             final_candidates,
             market_data,
-            self.api.get_balance()
+            account_info
         )
 
         # 5. 주문 실행 및 포지션 사이징
-        for d in decisions:
-            balance = self.api.get_balance()['cash']
-            # 켈리 공식 + 거시 필터 가중치 적용
-            pos = self.kelly.get_position_size(balance, d.get('price', 10000))
-            qty = int(pos['quantity'] * d['multiplier'])
-            
+        balance_cash = account_info['cash']
+        # 현재가를 모르는 종목은 수량도 손절 기준가도 정할 수 없으므로 제외
+        decisions = [d for d in decisions if d.get('price', 0) > 0]
+        if not decisions:
+            return
+        entry_prices = [d['price'] for d in decisions]
+        # 켈리 공식 수량은 시작 잔고 기준으로 한 번에 계산
+        quantities = self.kelly.get_position_sizes(balance_cash, entry_prices)
+        holdings = self.portfolio['holdings']
+        orders = []
+        new_symbols = 0
+        for d, entry_price, kelly_qty in zip(decisions, entry_prices, quantities):
+            # 남은 보유 한도나 현금을 다 썼으면 이후 후보는 볼 필요 없음
+            if new_symbols >= open_slots or balance_cash <= 0:
+                break
+            # 거시 필터 가중치 적용 후, 앞선 매수분을 뺀 현금을 넘지 않도록 제한
+            qty = min(int(kelly_qty * d['multiplier']), balance_cash // entry_price)
             if qty > 0:
-                self.api.place_order(d['symbol'], qty, 0, "buy")
-                logger.info(f"🛒 [v2.0] {d['name']} 매수 완료: {qty}주")
+                balance_cash -= qty * entry_price
+                orders.append((d, entry_price, qty))
+                # 이미 보유 중인 종목의 추가 매수는 보유 종목 수를 늘리지 않음
+                new_symbols += d['symbol'] not in holdings
+
+        results = self._place_orders([(d['symbol'], qty) for d, _, qty in orders], "buy")
+        # 분석/주문 중에 다른 프로세스가 파일을 바꿨을 수 있으므로 기록 직전에 다시 확인
+        # (저장 시 그 변경을 덮어쓰지 않도록)
+        self._refresh_portfolio()
+        holdings = self.portfolio['holdings']
+        buy_date = now.strftime('%Y%m%d')
+        for (d, entry_price, qty), ok in zip(orders, results):
+            if ok:
+                # 익일 청산 판단(monitor_and_exit)을 위해 진입가와 함께 보유 기록
+                self._add_holding(holdings, d['symbol'], d['name'], entry_price, qty, buy_date)
+                self._portfolio_dirty = True
+                logger.info("🛒 [v2.0] %s 매수 완료: %d주", d['name'], qty)
+
+        self._save_portfolio()
 
     def monitor_and_exit(self):
         """리스크 관리 및 청산 로직 실행"""
-        if not self.portfolio['holdings']: return
-        
-        for holding in self.portfolio['holdings']:
-            # 실시간 데이터 수집
-            data = self.api.get_realtime_analysis_data(holding['stock_code'])
+        self._refresh_portfolio()
+        # 루프에서 반복 참조하는 속성은 지역 변수로 한 번만 바인딩
+        holdings = self.portfolio['holdings']
+        if not holdings: return
+        evaluate = self.risk_manager.evaluate
+
+        # 보유 종목 실시간 데이터를 동시에 수집 (같은 시점의 시세로 판단, 초당 호출 수는 KISApi 공통 제한)
+        with ThreadPoolExecutor(max_workers=Config.API_MAX_WORKERS) as executor:
+            realtime_batch = list(executor.map(self.api.get_realtime_analysis_data, holdings))
+
+        # 모든 보유 종목을 같은 기준 시각/지수로 평가
+        now = datetime.now().time()
+        # 지수 시세 조회가 아직 없어 0.0 고정값 사용 (구현되면 패스당 1회 조회해 공유)
+        kospi_change = 0.0
+        to_sell = []
+        for (stock_code, holding), data in zip(holdings.items(), realtime_batch):
             data.update({
                 "entry_price": holding['buy_price'],
-                "kospi_change": 0.0, # 실제 데이터 필요
+                "kospi_change": kospi_change,
                 "ma20": holding.get('ma20', 0)
             })
             
             # StopLossEngine 평가
-            res = self.risk_manager.evaluate(data)
+            res = evaluate(data, now)
             if res['trigger']:
-                logger.warning(f"🔔 {holding['stock_name']} 청산 트리거: {res['type']} ({res['reason']})")
-                self.api.place_order(holding['stock_code'], holding['quantity'], 0, "sell")
+                logger.warning(
+                    "🔔 %s 청산 트리거: %s (%s)", holding['stock_name'], res['type'], res['reason']
+                )
+                to_sell.append((stock_code, holding['quantity']))
+
+        # 청산 주문은 동시에 제출하고, 체결된 종목만 제거한 뒤 한 번만 저장
+        results = self._place_orders(to_sell, "sell")
+        sold = {stock_code for (stock_code, _), ok in zip(to_sell, results) if ok}
+        if sold:
+            self.portfolio['holdings'] = {
+                code: holding for code, holding in holdings.items() if code not in sold
+            }
+            self._portfolio_dirty = True
+        self._save_portfolio()